@@ -15,6 +15,7 @@ from .cost_surface import CostSurfaceGenerator
 from .distance import DistanceCalculator
 from .fetch import DataFetcher
 from .preprocess import DataPreprocessor
+from .vector_io import read_vector, vector_path
 from .visualize import Visualizer
 
 
@@ -78,11 +79,9 @@ def preprocess(ctx):
         state_name = config.state_name.lower()
         raw_data_path = config.get_path('raw_data')
 
-        import geopandas as gpd
-
         state_folder = raw_data_path / state_name
-        boundary_file = state_folder / "boundary.geojson"
-        roads_file = state_folder / "roads.geojson"
+        boundary_file = vector_path(state_folder, "boundary")
+        roads_file = vector_path(state_folder, "roads")
 
         if not boundary_file.exists() or not roads_file.exists():
             click.echo("✗ Data not found. Please run 'fetch_data' first.",
@@ -90,8 +89,8 @@ def preprocess(ctx):
             return 1
 
         data = {
-            'boundary': gpd.read_file(boundary_file),
-            'roads': gpd.read_file(roads_file)
+            'boundary': read_vector(boundary_file),
+            'roads': read_vector(roads_file)
         }
 
         # Preprocess
@@ -156,13 +155,12 @@ def compute_distance(ctx):
         state_name = config.state_name.lower()
         processed_path = config.get_path('processed_data')
 
-        import geopandas as gpd
         import numpy as np
         import rasterio
 
         state_folder = processed_path / state_name
         state_folder.mkdir(parents=True, exist_ok=True)
-        boundary_file = state_folder / "boundary_projected.geojson"
+        boundary_file = vector_path(state_folder, "boundary_projected")
         road_mask_file = state_folder / "road_mask.tif"
 
         if not boundary_file.exists() or not road_mask_file.exists():
@@ -172,7 +170,7 @@ def compute_distance(ctx):
             return 1
 
         # Load data
-        boundary = gpd.read_file(boundary_file)
+        boundary = read_vector(boundary_file)
 
         with rasterio.open(road_mask_file) as src:
             road_mask = src.read(1)
@@ -220,7 +218,6 @@ def find_unreachable(ctx):
         processed_path = config.get_path('processed_data')
         raw_path = config.get_path('raw_data')
 
-        import geopandas as gpd
         import rasterio
 
         # Check which distance mode was used
@@ -231,7 +228,8 @@ def find_unreachable(ctx):
             distance_file = processed_state_folder / "distance_cost.tif"
         else:
             distance_file = processed_state_folder / "distance.tif"
-        boundary_file = processed_state_folder / "boundary_projected.geojson"
+        boundary_file = vector_path(processed_state_folder,
+                                    "boundary_projected")
         landcover_file = raw_state_folder / "landcover.tif"
 
         if not distance_file.exists():
@@ -251,7 +249,7 @@ def find_unreachable(ctx):
                 'bounds': src.bounds
             }
 
-        boundary = gpd.read_file(boundary_file)
+        boundary = read_vector(boundary_file)
 
         distance_data = {
             'distance_field': distance_field,
@@ -369,8 +367,9 @@ def visualize(ctx):
             distance_file = processed_state_folder / "distance_cost.tif"
         else:
             distance_file = processed_state_folder / "distance.tif"
-        boundary_file = processed_state_folder / "boundary_projected.geojson"
-        roads_file = processed_state_folder / "roads_clipped.geojson"
+        boundary_file = vector_path(processed_state_folder,
+                                    "boundary_projected")
+        roads_file = vector_path(processed_state_folder, "roads_clipped")
         results_file = config.get('output.results_file',
                                   'outputs/results.json')
 
@@ -394,8 +393,8 @@ def visualize(ctx):
                 'bounds': src.bounds
             }
 
-        boundary = gpd.read_file(boundary_file)
-        roads = gpd.read_file(
+        boundary = read_vector(boundary_file)
+        roads = read_vector(
             roads_file) if roads_file.exists() else gpd.GeoDataFrame()
 
         with open(results_file, 'r') as f:
@@ -456,11 +455,10 @@ def run_all(ctx, skip_fetch):
             raw_data_path = config.get_path('raw_data')
             state_folder = raw_data_path / state_name
 
-            import geopandas as gpd
-
             data = {
-                'boundary': gpd.read_file(state_folder / "boundary.geojson"),
-                'roads': gpd.read_file(state_folder / "roads.geojson")
+                'boundary': read_vector(vector_path(state_folder,
+                                                    "boundary")),
+                'roads': read_vector(vector_path(state_folder, "roads"))
             }
 
         # Step 2: Preprocess
@@ -6,17 +6,28 @@ Combines slope and land cover factors to create composite cost rasters.
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import Optional, Tuple
 
 import numpy as np
 import rasterio
 import yaml
+from rasterio.vrt import WarpedVRT
 from rasterio.warp import Resampling, reproject
 from scipy.ndimage import gaussian_filter
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 logger = logging.getLogger(__name__)
 
+# Worker threads for GDAL warping (leave one core free for the main process)
+WARP_THREADS = max(1, (os.cpu_count() or 2) - 1)
+
 # National Land Cover Database 2021 classification
 # Source: https://www.mrlc.gov/data/legends/national-land-cover-database-class-legend-and-description
 # Cost represents difficulty of foot travel
@@ -41,7 +52,67 @@ LANDCOVER_COSTS = {
 }
 
 
-def slope_cost_factor(slope_degrees: np.ndarray, config: dict) -> np.ndarray:
+# Slope cost lookup table resolution, in tangent space: tan(0°)=0 to tan(45°)=1
+SLOPE_LUT_BINS = 10001
+
+
+if HAS_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def _slope_tangent_kernel(dem, inv_2dx, inv_2dy, out):
+        """Central-difference gradient magnitude for interior pixels."""
+        height, width = dem.shape
+        for i in prange(1, height - 1):
+            for j in range(1, width - 1):
+                gx = (dem[i, j + 1] - dem[i, j - 1]) * inv_2dx
+                gy = (dem[i + 1, j] - dem[i - 1, j]) * inv_2dy
+                out[i, j] = np.sqrt(gx * gx + gy * gy)
+
+
+def _slope_tangent_edges(dem: np.ndarray, dx: float, dy: float,
+                         out: np.ndarray):
+    """Fill border pixels with one-sided differences, as np.gradient does."""
+    for row, gy in ((0, (dem[1] - dem[0]) / dy),
+                    (-1, (dem[-1] - dem[-2]) / dy)):
+        out[row] = np.hypot(np.gradient(dem[row], dx), gy)
+
+    for col, gx in ((0, (dem[:, 1] - dem[:, 0]) / dx),
+                    (-1, (dem[:, -1] - dem[:, -2]) / dx)):
+        out[:, col] = np.hypot(gx, np.gradient(dem[:, col], dy))
+
+
+def slope_tangent(dem: np.ndarray, dx: float, dy: float) -> np.ndarray:
+    """
+    Calculate slope tangent (gradient magnitude, rise/run) from a DEM.
+    
+    Uses a fused parallel Numba kernel when numba is installed, otherwise
+    falls back to np.gradient.
+    
+    Args:
+        dem: Elevation array
+        dx: Pixel width in map units
+        dy: Pixel height in map units
+        
+    Returns:
+        Float32 array of slope tangents (same shape as dem)
+    """
+    dem = dem.astype(np.float32, copy=False)
+
+    if HAS_NUMBA and dem.shape[0] >= 3 and dem.shape[1] >= 3:
+        out = np.empty(dem.shape, dtype=np.float32)
+        _slope_tangent_kernel(dem, np.float32(0.5 / dx), np.float32(0.5 / dy),
+                              out)
+        _slope_tangent_edges(dem, dx, dy, out)
+        return out
+
+    grad_x = np.gradient(dem, dx, axis=1)
+    grad_y = np.gradient(dem, dy, axis=0)
+    return np.hypot(grad_x, grad_y).astype(np.float32, copy=False)
+
+
+def slope_cost_factor(slope_tan: np.ndarray,
+                      config: dict,
+                      weight: float = 1.0) -> np.ndarray:
     """
     Calculate cost multipliers based on slope.
     
@@ -51,12 +122,18 @@ def slope_cost_factor(slope_degrees: np.ndarray, config: dict) -> np.ndarray:
     - 30°: 4.0x (steep)
     - 45°+: 10.0x (very steep)
     
+    Slope is passed as its tangent (gradient magnitude, rise/run) so no
+    per-pixel arctan is needed. The curve in degrees, raised to ``weight``,
+    is evaluated once into a lookup table indexed by tangent; each pixel
+    then costs a single gather.
+    
     Args:
-        slope_degrees: Array of slope values in degrees
+        slope_tan: Array of slope tangents (rise/run)
         config: Configuration dictionary with slope thresholds
+        weight: Exponent applied to the cost multipliers
         
     Returns:
-        Array of cost multipliers (same shape as slope_degrees)
+        Array of cost multipliers (same shape as slope_tan)
     """
     slope_config = config.get('cost_distance', {}).get('slope', {})
 
@@ -66,51 +143,45 @@ def slope_cost_factor(slope_degrees: np.ndarray, config: dict) -> np.ndarray:
     steep_cost = slope_config.get('steep', 4.0)
     very_steep_cost = slope_config.get('very_steep', 10.0)
 
-    # Initialize with flat cost
-    cost = np.full_like(slope_degrees, flat_cost, dtype=np.float32)
-
-    # Apply piecewise linear interpolation
-    # 0° to 15°
-    mask = (slope_degrees > 0) & (slope_degrees <= 15)
-    cost[mask] = flat_cost + (moderate_cost -
-                              flat_cost) * (slope_degrees[mask] / 15.0)
+    # Build lookup table over tan in [0, 1] (0° to 45°); steeper slopes
+    # clamp to the last bin
+    lut_degrees = np.degrees(np.arctan(np.linspace(0.0, 1.0, SLOPE_LUT_BINS)))
+    slope_lut = np.interp(
+        lut_degrees, [0.0, 15.0, 30.0, 45.0],
+        [flat_cost, moderate_cost, steep_cost, very_steep_cost])
+    slope_lut = (slope_lut**weight).astype(np.float32)
 
-    # 15° to 30°
-    mask = (slope_degrees > 15) & (slope_degrees <= 30)
-    cost[mask] = moderate_cost + (steep_cost - moderate_cost) * (
-        (slope_degrees[mask] - 15) / 15.0)
+    # NaN slopes fall into bin 0 (flat)
+    index = np.nan_to_num(slope_tan * (SLOPE_LUT_BINS - 1), nan=0.0)
+    index = np.clip(index, 0, SLOPE_LUT_BINS - 1).astype(np.int32)
 
-    # 30° to 45°
-    mask = (slope_degrees > 30) & (slope_degrees <= 45)
-    cost[mask] = steep_cost + (very_steep_cost - steep_cost) * (
-        (slope_degrees[mask] - 30) / 15.0)
+    return slope_lut[index]
 
-    # 45°+
-    mask = slope_degrees > 45
-    cost[mask] = very_steep_cost
 
-    return cost
-
-
-def landcover_cost_factor(landcover: np.ndarray) -> np.ndarray:
+def landcover_cost_factor(landcover: np.ndarray,
+                          weight: float = 1.0) -> np.ndarray:
     """
     Calculate cost multipliers based on land cover type.
     
     Args:
         landcover: Array of NLCD land cover codes
+        weight: Exponent applied to the cost multipliers
         
     Returns:
         Array of cost multipliers (same shape as landcover)
     """
-    # Default cost for unknown land cover types
-    cost = np.ones_like(landcover, dtype=np.float32)
-
-    # Apply costs from lookup table
+    # 256-entry lookup table keyed by raw code; unknown types cost 1.0
+    landcover_lut = np.ones(256, dtype=np.float32)
     for lc_code, lc_cost in LANDCOVER_COSTS.items():
-        mask = (landcover == lc_code)
-        cost[mask] = lc_cost
+        landcover_lut[lc_code] = lc_cost**weight
+
+    if landcover.dtype == np.uint8:
+        return landcover_lut[landcover]
 
-    return cost
+    # Wider integer types: codes outside 0-255 get the default cost
+    in_range = (landcover >= 0) & (landcover < 256)
+    return np.where(in_range, landcover_lut[np.clip(landcover, 0, 255)],
+                    np.float32(1.0))
 
 
 class CostSurfaceGenerator:
@@ -156,19 +227,26 @@ class CostSurfaceGenerator:
                         dem_path: str,
                         output_path: Optional[str] = None) -> np.ndarray:
         """
-        Calculate slope in degrees from a DEM.
+        Calculate slope from a DEM.
+        
+        Slope is returned as its tangent (gradient magnitude, rise/run),
+        which is what slope_cost_factor consumes. It is only converted to
+        degrees when writing the slope raster.
         
         Args:
             dem_path: Path to DEM raster file
-            output_path: Optional path to save slope raster
+            output_path: Optional path to save slope raster (in degrees)
             
         Returns:
-            Slope array in degrees
+            Slope tangent array
         """
         logger.info(f"Calculating slope from {dem_path}")
 
         with rasterio.open(dem_path) as src:
-            dem = src.read(1, masked=True)
+            # Plain ndarray with nodata as NaN (masked arrays slow every op)
+            dem = src.read(1).astype(np.float32, copy=False)
+            if src.nodata is not None:
+                np.putmask(dem, dem == src.nodata, np.float32(np.nan))
             transform = src.transform
             profile = src.profile
 
@@ -177,28 +255,34 @@ class CostSurfaceGenerator:
             dx = np.abs(transform.a)  # pixel width
             dy = np.abs(transform.e)  # pixel height
 
-            # Sobel filters for gradient estimation
-            grad_x = np.gradient(dem, dx, axis=1)
-            grad_y = np.gradient(dem, dy, axis=0)
+            # Slope magnitude as tangent (no arctan/degrees pass needed)
+            slope_tan = slope_tangent(dem, dx, dy)
 
-            # Calculate slope magnitude
-            slope_radians = np.arctan(np.sqrt(grad_x**2 + grad_y**2))
-            slope_degrees = np.degrees(slope_radians)
+            # Nodata (and its neighbours) is treated as flat terrain
+            np.nan_to_num(slope_tan, copy=False, nan=0.0)
 
-            # Apply light smoothing to reduce noise
-            slope_degrees = gaussian_filter(slope_degrees, sigma=1.0)
+            # Optional light smoothing to reduce noise (many DEMs are
+            # already smoothed); truncate=3.0 gives a 7x7 kernel at sigma=1
+            smooth_sigma = self.cost_config.get('slope',
+                                                {}).get('smooth_sigma', 0.0)
+            if smooth_sigma > 0:
+                slope_tan = gaussian_filter(slope_tan,
+                                            sigma=smooth_sigma,
+                                            truncate=3.0,
+                                            mode='nearest')
 
             # Save if requested
             if output_path:
                 profile.update(dtype=rasterio.float32, count=1, nodata=-9999)
                 with rasterio.open(output_path, 'w', **profile) as dst:
-                    dst.write(slope_degrees.astype(np.float32), 1)
+                    dst.write(
+                        np.degrees(np.arctan(slope_tan)).astype(np.float32), 1)
                 logger.info(f"Saved slope raster to {output_path}")
 
-        logger.info(
-            f"Slope range: {slope_degrees.min():.1f}° to {slope_degrees.max():.1f}°"
-        )
-        return slope_degrees
+        min_degrees = np.degrees(np.arctan(slope_tan.min()))
+        max_degrees = np.degrees(np.arctan(slope_tan.max()))
+        logger.info(f"Slope range: {min_degrees:.1f}° to {max_degrees:.1f}°")
+        return slope_tan
 
     def resample_landcover(self,
                            landcover_path: str,
@@ -223,22 +307,19 @@ class CostSurfaceGenerator:
             template_transform = template.transform
             template_shape = (template.height, template.width)
 
-        # Read and resample land cover
-        with rasterio.open(landcover_path) as src:
-            # Create output array
-            landcover = np.zeros(template_shape, dtype=src.dtypes[0])
-
-            # Reproject to match template
-            reproject(
-                source=rasterio.band(src, 1),
-                destination=landcover,
-                src_transform=src.transform,
-                src_crs=src.crs,
-                dst_transform=template_transform,
-                dst_crs=template_profile['crs'],
-                resampling=Resampling.
-                nearest  # Use nearest for categorical data
-            )
+        # Read land cover through a warped VRT on the template grid so GDAL
+        # streams the nearest-neighbour resample block by block
+        with rasterio.Env(GDAL_NUM_THREADS='ALL_CPUS', GDAL_CACHEMAX=512), \
+                rasterio.open(landcover_path) as src, \
+                WarpedVRT(src,
+                          crs=template_profile['crs'],
+                          transform=template_transform,
+                          width=template_shape[1],
+                          height=template_shape[0],
+                          resampling=Resampling.nearest,  # Categorical data
+                          warp_mem_limit=512,
+                          num_threads=WARP_THREADS) as vrt:
+            landcover = vrt.read(1)
 
         # Save if requested
         if output_path:
@@ -247,8 +328,13 @@ class CostSurfaceGenerator:
                 dst.write(landcover, 1)
             logger.info(f"Saved resampled land cover to {output_path}")
 
-        unique_codes = np.unique(landcover)
-        logger.info(f"Land cover codes present: {len(unique_codes)}")
+        # Linear-time count of distinct codes (no sort) for byte-sized data
+        if landcover.dtype == np.uint8:
+            n_codes = int(
+                np.count_nonzero(np.bincount(landcover.ravel(), minlength=256)))
+        else:
+            n_codes = len(np.unique(landcover))
+        logger.info(f"Land cover codes present: {n_codes}")
         return landcover
 
     def generate_cost_surface(
@@ -281,8 +367,9 @@ class CostSurfaceGenerator:
 
         # Calculate slope costs
         if dem_path:
-            slope_degrees = self.calculate_slope(dem_path)
-            slope_costs = slope_cost_factor(slope_degrees, self.config)
+            slope_tan = self.calculate_slope(dem_path)
+            slope_costs = slope_cost_factor(slope_tan, self.config,
+                                            self.slope_weight)
         else:
             # No DEM: assume flat terrain (cost = 1.0)
             logger.info(
@@ -292,7 +379,8 @@ class CostSurfaceGenerator:
         # Calculate land cover costs
         if landcover_path:
             landcover = self.resample_landcover(landcover_path, reference_path)
-            landcover_costs = landcover_cost_factor(landcover)
+            landcover_costs = landcover_cost_factor(landcover,
+                                                    self.landcover_weight)
 
             # Identify water bodies (will be set to nodata later)
             water_mask = (landcover == 11) | (landcover == 12
@@ -305,10 +393,9 @@ class CostSurfaceGenerator:
             landcover_costs = np.ones(reference_shape, dtype=np.float32)
             water_mask = np.zeros(reference_shape, dtype=bool)
 
-        # Combine costs with weights
+        # Combine costs (weights are already applied by the lookup tables)
         # Cost = slope_cost^slope_weight * landcover_cost^landcover_weight
-        cost_surface = (slope_costs**self.slope_weight) * (
-            landcover_costs**self.landcover_weight)
+        cost_surface = slope_costs * landcover_costs
 
         # Ensure minimum cost of 1.0
         cost_surface = np.maximum(cost_surface, 1.0)
@@ -169,12 +169,16 @@ class DistanceCalculator:
 
         print("Masking distance field to boundary...")
 
-        # Create masked array
-        masked_field = distance_field.copy().astype(np.float32)
-        masked_field[boundary_mask == 0] = np.nan
+        # Single pass: keep values inside the boundary, NaN elsewhere
+        # (boundary mask holds 0/1, so it can be viewed as bool without a copy)
+        inside = boundary_mask.view(np.bool_) if boundary_mask.dtype == np.uint8 \
+            else boundary_mask.astype(bool)
+        masked_field = np.where(inside,
+                                distance_field.astype(np.float32, copy=False),
+                                np.float32(np.nan))
 
         # Count valid pixels
-        valid_pixels = np.sum(~np.isnan(masked_field))
+        valid_pixels = int(np.count_nonzero(inside))
         total_pixels = masked_field.size
 
         print(
@@ -212,6 +216,38 @@ class DistanceCalculator:
 
         return boundary_mask
 
+    def boundary_window(self, boundary_mask: np.ndarray,
+                        road_mask: Optional[np.ndarray] = None
+                        ) -> Tuple[slice, slice]:
+        """
+        Find the smallest row/column window containing the boundary.
+        
+        Road pixels are included as well, since roads rasterized with
+        all_touched can fall just outside the boundary mask.
+        
+        Args:
+            boundary_mask: Binary mask (1 = inside boundary, 0 = outside)
+            road_mask: Optional binary road mask to include in the window
+            
+        Returns:
+            Tuple of (row_slice, col_slice) covering all nonzero pixels
+        """
+        rows_any = boundary_mask.any(axis=1)
+        cols_any = boundary_mask.any(axis=0)
+        if road_mask is not None:
+            rows_any |= road_mask.any(axis=1)
+            cols_any |= road_mask.any(axis=0)
+
+        if not rows_any.any():
+            return slice(0, boundary_mask.shape[0]), slice(
+                0, boundary_mask.shape[1])
+
+        rows = np.flatnonzero(rows_any)
+        cols = np.flatnonzero(cols_any)
+
+        return (slice(int(rows[0]), int(rows[-1]) + 1),
+                slice(int(cols[0]), int(cols[-1]) + 1))
+
     def save_distance_raster(self, distance_field: np.ndarray, metadata: dict,
                              output_path: Path):
         """
@@ -225,11 +261,13 @@ class DistanceCalculator:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        print(f"Saving distance raster to {output_path}")
+        # The pipeline produces float32 throughout; casting here would
+        # allocate a second full-size copy at write time
+        if distance_field.dtype != np.float32:
+            raise ValueError(
+                f"Distance field must be float32, got {distance_field.dtype}")
 
-        # Ensure 3D array
-        if distance_field.ndim == 2:
-            distance_field = distance_field[np.newaxis, :, :]
+        print(f"Saving distance raster to {output_path}")
 
         with rasterio.open(output_path,
                            'w',
@@ -240,9 +278,19 @@ class DistanceCalculator:
                            dtype=np.float32,
                            crs=metadata['crs'],
                            transform=metadata['transform'],
-                           compress='lzw',
-                           nodata=np.nan) as dst:
-            dst.write(distance_field.astype(np.float32))
+                           nodata=np.nan,
+                           compress='deflate',
+                           predictor=3,  # Floating-point predictor
+                           zlevel=6,
+                           tiled=True,
+                           blockxsize=512,
+                           blockysize=512,
+                           BIGTIFF='IF_SAFER',
+                           num_threads='all_cpus') as dst:
+            if distance_field.ndim == 2:
+                dst.write(distance_field, 1)
+            else:
+                dst.write(distance_field)
 
         print(f"Saved distance raster")
 
@@ -301,25 +349,33 @@ class DistanceCalculator:
 
                 print(f"  Cost surface loaded: {cost_surface.shape}")
 
+        # Create boundary mask first so the distance transform only has to
+        # cover the bounding window of the boundary (and any road pixels)
+        print("\n1. Creating boundary mask...")
+        boundary_mask = self.create_boundary_mask(
+            boundary, (metadata['height'], metadata['width']),
+            metadata['transform'])
+        window = self.boundary_window(boundary_mask, road_mask)
+        window_shape = (window[0].stop - window[0].start,
+                        window[1].stop - window[1].start)
+        print(f"  Working window: {window_shape[0]}x{window_shape[1]} "
+              f"of {road_mask.shape[0]}x{road_mask.shape[1]} pixels")
+
         # Compute distance field
         if use_cost_distance:
-            print("\n1. Computing cost-weighted distance transform...")
+            print("\n2. Computing cost-weighted distance transform...")
             distance_field = self.compute_cost_distance_field(
-                road_mask, cost_surface)
+                road_mask[window], cost_surface[window])
         else:
             print("\nMode: EUCLIDEAN (straight-line distance)")
-            print("\n1. Computing Euclidean distance transform...")
-            distance_field = self.compute_distance_field(road_mask)
-
-        # Create boundary mask
-        print("\n2. Creating boundary mask...")
-        boundary_mask = self.create_boundary_mask(
-            boundary, (metadata['height'], metadata['width']),
-            metadata['transform'])
+            print("\n2. Computing Euclidean distance transform...")
+            distance_field = self.compute_distance_field(road_mask[window])
 
-        # Mask distance field
+        # Mask distance field and place it back on the full raster grid
         print("\n3. Masking to boundary...")
-        distance_masked = self.mask_by_boundary(distance_field, boundary_mask)
+        distance_masked = np.full(road_mask.shape, np.nan, dtype=np.float32)
+        distance_masked[window] = self.mask_by_boundary(
+            distance_field, boundary_mask[window])
 
         # Save if configured
         if self.config.get('output.save_intermediate', True):
@@ -4,24 +4,228 @@ Utility script to extract terrain data from national files for a specific state.
 This handles automatic extraction of DEM and land cover from national files
 when cost-distance analysis is enabled.
 """
+import json
+import math
+import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from .config import get_config
+from .vector_io import vector_path
+
+try:
+    from osgeo import gdal
+    HAS_GDAL = True
+except ImportError:
+    HAS_GDAL = False
+
+# GMTED2010 tile folder names, e.g. GMTED2010N30W120_075
+_GMTED_RE = re.compile(r'GMTED2010N(\d+)W(\d+)_\d+')
+
+# Tile origin anywhere in a folder name, in either order and any case,
+# e.g. GMTED2010N30W120_150 or 30n120w_20101117_gmted
+_GMTED_ORIGIN_RES = (
+    re.compile(r'([NS])(\d{1,2})([EW])(\d{1,3})', re.IGNORECASE),
+    re.compile(r'(\d{1,2})([NS])(\d{1,3})([EW])', re.IGNORECASE),
+)
+
+# Spatial index of tile folders per GMTED directory (in memory only):
+# (directory mtime, STRtree, folder paths)
+_TILE_INDEX = {}
+
+# Keep every GMTED tile of a large mosaic open instead of cycling through
+# GDAL's default pool of 100 datasets
+GDAL_MAX_DATASET_POOL_SIZE = '450'
+
+# Threading and tiled-output options shared by every gdalwarp invocation.
+# Output is 512x512-tiled so downstream windowed reads decode whole blocks
+# instead of full scanlines. The LZW predictor depends on the source data
+# type (see source_predictor).
+GDALWARP_OPTIONS = [
+    '-multi', '-wo', 'NUM_THREADS=ALL_CPUS', '-wm', '2048', '-co',
+    'TILED=YES', '-co', 'BLOCKXSIZE=512', '-co', 'BLOCKYSIZE=512', '-co',
+    'COMPRESS=LZW', '-co', 'BIGTIFF=IF_SAFER', '-co', 'NUM_THREADS=ALL_CPUS'
+]
+
+# GDAL configuration options for warping (passed via --config on the CLI)
+GDALWARP_CONFIG = {'GDAL_CACHEMAX': '40%'}
+
+
+def source_predictor(source) -> Optional[str]:
+    """
+    Pick the GeoTIFF predictor for a warp output from the source data type.
+    
+    Floating-point predictor (3) for float DEMs, horizontal differencing (2)
+    for integer rasters such as NLCD land cover.
+    
+    Args:
+        source: Input raster path or open GDAL dataset
+        
+    Returns:
+        "3", "2", or None if the source cannot be opened
+    """
+    if HAS_GDAL:
+        ds = source if not isinstance(source, (str, Path)) else gdal.Open(
+            str(source))
+        if ds is None:
+            return None
+        data_type = ds.GetRasterBand(1).DataType
+        is_float = data_type in (gdal.GDT_Float32, gdal.GDT_Float64)
+    else:
+        import numpy as np
+        import rasterio
+
+        try:
+            with rasterio.open(str(source)) as src:
+                is_float = np.issubdtype(np.dtype(src.dtypes[0]), np.floating)
+        except rasterio.errors.RasterioIOError:
+            return None
+
+    return '3' if is_float else '2'
+
+
+def gdalwarp_options(state_boundary_path: Path,
+                     t_srs: Optional[str] = None,
+                     tr: Optional[float] = None,
+                     resampling: Optional[str] = None,
+                     num_threads: str = 'ALL_CPUS',
+                     predictor: Optional[str] = None) -> List[str]:
+    """
+    Build gdalwarp options that clip to the state boundary.
+    
+    Reprojection and resampling are folded into the same call, so the
+    raster is only read and written once. The list is accepted both by the
+    gdalwarp command and by gdal.Warp(options=...).
+    
+    Args:
+        state_boundary_path: Path to state boundary used as cutline
+        t_srs: Optional target CRS (e.g., "EPSG:5070")
+        tr: Optional target resolution in target CRS units
+        resampling: Optional resampling method (e.g., "bilinear")
+        num_threads: Warp and compression threads ("ALL_CPUS" or a count)
+        predictor: Optional GeoTIFF predictor (see source_predictor)
+        
+    Returns:
+        List of gdalwarp options (without source and destination)
+    """
+    options = [
+        o.replace('ALL_CPUS', str(num_threads)) for o in GDALWARP_OPTIONS
+    ]
+
+    if predictor:
+        options += ['-co', f'PREDICTOR={predictor}']
+
+    if t_srs:
+        options += ['-t_srs', str(t_srs)]
+    if tr:
+        options += ['-tr', str(tr), str(tr)]
+    if resampling:
+        options += ['-r', str(resampling)]
+
+    return options + [
+        '-cutline', str(state_boundary_path), '-crop_to_cutline'
+    ]
+
+
+def gdalwarp_command(source: Path,
+                     state_boundary_path: Path,
+                     output_path: Path,
+                     t_srs: Optional[str] = None,
+                     tr: Optional[float] = None,
+                     resampling: Optional[str] = None,
+                     num_threads: str = 'ALL_CPUS') -> List[str]:
+    """
+    Build a threaded gdalwarp command that clips source to the state boundary.
+    
+    Args:
+        source: Input raster (file or VRT)
+        state_boundary_path: Path to state boundary used as cutline
+        output_path: Where to save the clipped raster
+        t_srs: Optional target CRS (e.g., "EPSG:5070")
+        tr: Optional target resolution in target CRS units
+        resampling: Optional resampling method (e.g., "bilinear")
+        num_threads: Warp and compression threads ("ALL_CPUS" or a count)
+        
+    Returns:
+        Command as a list of arguments for subprocess.run
+    """
+    cmd = ['gdalwarp']
+    for key, value in GDALWARP_CONFIG.items():
+        cmd += ['--config', key, value]
+
+    cmd += gdalwarp_options(state_boundary_path, t_srs, tr, resampling,
+                            num_threads, source_predictor(source))
+
+    return cmd + [str(source), str(output_path)]
 
 
-def extract_from_national_file(national_file: Path, state_boundary_path: Path,
-                               output_path: Path) -> bool:
+def warp_in_process(source,
+                    state_boundary_path: Path,
+                    output_path: Path,
+                    t_srs: Optional[str] = None,
+                    tr: Optional[float] = None,
+                    resampling: Optional[str] = None,
+                    num_threads: str = 'ALL_CPUS') -> bool:
+    """
+    Clip source to the state boundary with gdal.Warp (no subprocess).
+    
+    Args:
+        source: Input raster path or open GDAL dataset (e.g., in-memory VRT)
+        state_boundary_path: Path to state boundary used as cutline
+        output_path: Where to save the clipped raster
+        t_srs: Optional target CRS (e.g., "EPSG:5070")
+        tr: Optional target resolution in target CRS units
+        resampling: Optional resampling method (e.g., "bilinear")
+        num_threads: Warp and compression threads ("ALL_CPUS" or a count)
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    for key, value in GDALWARP_CONFIG.items():
+        gdal.SetConfigOption(key, value)
+
+    if isinstance(source, Path):
+        source = str(source)
+
+    ds = gdal.Warp(str(output_path),
+                   source,
+                   options=gdalwarp_options(state_boundary_path, t_srs, tr,
+                                            resampling, num_threads,
+                                            source_predictor(source)))
+    if ds is None:
+        print(f"  ✗ gdal.Warp failed: {gdal.GetLastErrorMsg()}")
+        return False
+
+    ds.FlushCache()
+    ds = None
+    return True
+
+
+def extract_from_national_file(national_file: Path,
+                               state_boundary_path: Path,
+                               output_path: Path,
+                               t_srs: Optional[str] = None,
+                               tr: Optional[float] = None,
+                               resampling: Optional[str] = None,
+                               num_threads: str = 'ALL_CPUS') -> bool:
     """
     Extract state-specific data from national raster file using gdalwarp.
     
+    Runs gdal.Warp in-process when the GDAL Python bindings are installed,
+    otherwise the gdalwarp command.
+    
     Args:
         national_file: Path to national raster (e.g., NLCD for whole USA)
-        state_boundary_path: Path to state boundary GeoJSON
+        state_boundary_path: Path to state boundary (FlatGeobuf or GeoJSON)
         output_path: Where to save extracted state raster
+        t_srs: Optional target CRS to reproject to in the same pass
+        tr: Optional target resolution in target CRS units
+        resampling: Optional resampling method for reprojection
+        num_threads: Warp and compression threads ("ALL_CPUS" or a count)
         
     Returns:
         True if successful, False otherwise
@@ -30,13 +234,19 @@ def extract_from_national_file(national_file: Path, state_boundary_path: Path,
         print(f"Extracting {output_path.name} from national file...")
         print(f"  Source: {national_file.name}")
 
-        cmd = [
-            'gdalwarp', '-cutline',
-            str(state_boundary_path), '-crop_to_cutline', '-co',
-            'COMPRESS=LZW',
-            str(national_file),
-            str(output_path)
-        ]
+        if HAS_GDAL:
+            # Warp in-process: no gdalwarp spawn per raster
+            if not warp_in_process(national_file, state_boundary_path,
+                                   output_path, t_srs, tr, resampling,
+                                   num_threads):
+                return False
+
+            print(f"  ✓ Extracted to {output_path}")
+            return True
+
+        cmd = gdalwarp_command(national_file, state_boundary_path,
+                               output_path, t_srs, tr, resampling,
+                               num_threads)
 
         result = subprocess.run(cmd,
                                 capture_output=True,
@@ -78,8 +288,7 @@ def parse_gmted_tile_bounds(
     Returns:
         Tuple of (min_lon, min_lat, max_lon, max_lat) or None if invalid
     """
-    pattern = r'GMTED2010N(\d+)W(\d+)_\d+'
-    match = re.match(pattern, folder_name)
+    match = _GMTED_RE.match(folder_name)
 
     if not match:
         return None
@@ -96,12 +305,120 @@ def parse_gmted_tile_bounds(
     return (min_lon, min_lat, max_lon, max_lat)
 
 
+def gmted_candidate_dirs(
+        state_bounds: tuple[float, float, float, float]) -> List[str]:
+    """
+    Compute the names of GMTED tile folders that can intersect given bounds.
+    
+    GMTED tiles lie on a fixed 30° × 20° grid (longitude starts at multiples
+    of 30°W, latitude starts at 10°N + multiples of 20°), so the candidate
+    folders follow directly from the bounds without scanning the directory.
+    
+    Args:
+        state_bounds: Tuple of (min_lon, min_lat, max_lon, max_lat) in EPSG:4326
+        
+    Returns:
+        List of folder names, e.g. ["GMTED2010N30W120_075"]
+    """
+    min_lon, min_lat, max_lon, max_lat = state_bounds
+
+    # Tile spans [-lon_start, -lon_start + 30] × [lat_start, lat_start + 20]
+    lon_first = max(0, math.ceil(-max_lon / 30) * 30)
+    lon_last = math.floor((30 - min_lon) / 30) * 30
+    lat_first = max(10, 10 + math.ceil((min_lat - 30) / 20) * 20)
+    lat_last = 10 + math.floor((max_lat - 10) / 20) * 20
+
+    return [
+        f"GMTED2010N{lat:02d}W{lon:03d}_075"
+        for lat in range(lat_first, lat_last + 1, 20)
+        for lon in range(lon_first, lon_last + 1, 30)
+    ]
+
+
+def _parse_tile_origin_bounds(
+        folder_name: str) -> Optional[tuple[float, float, float, float]]:
+    """
+    Parse tile bounds from a loosely named GMTED folder.
+    
+    Accepts the origin in either order (N30W120 or 30n120w), any case and
+    any resolution suffix. Tiles are assumed to be 30° × 20° as on the
+    standard grid.
+    
+    Args:
+        folder_name: Folder name containing the tile origin
+        
+    Returns:
+        Tuple of (min_lon, min_lat, max_lon, max_lat) or None if no origin
+    """
+    for regex in _GMTED_ORIGIN_RES:
+        match = regex.search(folder_name)
+        if not match:
+            continue
+
+        groups = [g.upper() for g in match.groups()]
+        if groups[0].isalpha():
+            lat_hemi, lat, lon_hemi, lon = groups
+        else:
+            lat, lat_hemi, lon, lon_hemi = groups
+
+        min_lat = int(lat) if lat_hemi == 'N' else -int(lat)
+        min_lon = int(lon) if lon_hemi == 'E' else -int(lon)
+        return (min_lon, min_lat, min_lon + 30, min_lat + 20)
+
+    return None
+
+
+def gmted_tile_index(gmted_dir: Path):
+    """
+    Get an STRtree over the bounds of all GMTED tile folders in gmted_dir.
+    
+    Folders are parsed with _parse_tile_origin_bounds, so layouts that do
+    not follow the GMTED2010N30W120_075 naming are still indexed. The index
+    is kept in memory per directory and rebuilt when the directory's
+    modification time changes.
+    
+    Args:
+        gmted_dir: Path to GMTED2010 directory
+        
+    Returns:
+        Tuple of (STRtree of tile boxes, list of tile folder paths)
+    """
+    from shapely.geometry import box
+    from shapely.strtree import STRtree
+
+    gmted_dir = Path(gmted_dir)
+    mtime = gmted_dir.stat().st_mtime
+
+    cached = _TILE_INDEX.get(gmted_dir)
+    if cached and cached[0] == mtime:
+        return cached[1], cached[2]
+
+    boxes = []
+    tile_dirs = []
+    for tile_dir in sorted(gmted_dir.iterdir()):
+        if not tile_dir.is_dir():
+            continue
+        tile_bounds = _parse_tile_origin_bounds(tile_dir.name)
+        if tile_bounds:
+            boxes.append(box(*tile_bounds))
+            tile_dirs.append(tile_dir)
+
+    tree = STRtree(boxes)
+    _TILE_INDEX[gmted_dir] = (mtime, tree, tile_dirs)
+
+    return tree, tile_dirs
+
+
 def find_gmted_tiles(gmted_dir: Path,
                      state_bounds: tuple[float, float, float, float],
                      variant: str = 'mea') -> List[Path]:
     """
     Find all GMTED tiles that intersect with given state bounds.
     
+    Tile folders are looked up by name on the GMTED grid; if that finds no
+    tiles (e.g., renamed folders or only the 15/30 arc-second products), the
+    spatial index of all loosely named folders is queried instead.
+    
     Args:
         gmted_dir: Path to GMTED2010 directory
         state_bounds: Tuple of (min_lon, min_lat, max_lon, max_lat) in EPSG:4326
@@ -113,51 +430,125 @@ def find_gmted_tiles(gmted_dir: Path,
     if not gmted_dir.exists():
         return []
 
-    state_min_lon, state_min_lat, state_max_lon, state_max_lat = state_bounds
-    matching_tiles = []
+    pattern = f"*_gmted_{variant}075.tif"
 
-    # Scan all GMTED tile folders
-    for tile_dir in sorted(gmted_dir.iterdir()):
-        if not tile_dir.is_dir() or not tile_dir.name.startswith('GMTED2010'):
-            continue
+    candidate_dirs = [
+        gmted_dir / name for name in gmted_candidate_dirs(state_bounds)
+    ]
 
-        tile_bounds = parse_gmted_tile_bounds(tile_dir.name)
-        if not tile_bounds:
-            continue
+    matching_tiles = []
+    for tile_dir in sorted(d for d in candidate_dirs if d.is_dir()):
+        matching_files = list(tile_dir.glob(pattern))
+        if matching_files:
+            matching_tiles.append(matching_files[0])
+
+    if matching_tiles:
+        return matching_tiles
 
-        tile_min_lon, tile_min_lat, tile_max_lon, tile_max_lat = tile_bounds
+    # Non-standard layout: query the spatial index of all tile folders and
+    # accept the variant at any resolution
+    from shapely.geometry import box
 
-        # Check for intersection
-        if (tile_max_lon >= state_min_lon and tile_min_lon <= state_max_lon
-                and tile_max_lat >= state_min_lat
-                and tile_min_lat <= state_max_lat):
+    tree, tile_dirs = gmted_tile_index(gmted_dir)
+    loose_pattern = f"*gmted_{variant}*.tif"
 
-            # Find the specific variant file
-            pattern = f"*_gmted_{variant}075.tif"
-            matching_files = list(tile_dir.glob(pattern))
+    for i in sorted(tree.query(box(*state_bounds))):
+        # Prefer the 7.5 arc-second file, then the finest other resolution
+        matching_files = (sorted(tile_dirs[i].glob(pattern)) or
+                          sorted(tile_dirs[i].glob(loose_pattern)))
 
-            if matching_files:
-                matching_tiles.append(matching_files[0])
+        if matching_files:
+            matching_tiles.append(matching_files[0])
 
     return matching_tiles
 
 
-def create_gmted_vrt(gmted_tiles: List[Path], output_vrt: Path) -> bool:
+def find_gmted_tiles_cached(gmted_dir: Path, state_boundary_path: Path,
+                            state_bounds: tuple[float, float, float, float],
+                            variant: str = 'mea') -> List[Path]:
     """
-    Create a virtual raster (VRT) that mosaics multiple GMTED tiles.
+    Find GMTED tiles for a state, caching the result next to its boundary.
+    
+    The cache (gmted_tiles.json) is keyed by GMTED directory and variant and
+    is ignored if any cached tile no longer exists.
     
     Args:
-        gmted_tiles: List of GMTED .tif files to mosaic
+        gmted_dir: Path to GMTED2010 directory
+        state_boundary_path: Path to state boundary (FlatGeobuf or GeoJSON)
+        state_bounds: Tuple of (min_lon, min_lat, max_lon, max_lat) in EPSG:4326
+        variant: GMTED variant to use (mea, med, min, max, etc.)
+        
+    Returns:
+        List of paths to GMTED .tif files that cover the state
+    """
+    cache_path = state_boundary_path.parent / "gmted_tiles.json"
+    key = f"{Path(gmted_dir).resolve()}:{variant}"
+
+    cache = {}
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+
+    if key in cache:
+        tiles = [Path(t) for t in cache[key]]
+        if tiles and all(t.exists() for t in tiles):
+            return tiles
+
+    tiles = find_gmted_tiles(gmted_dir, state_bounds, variant)
+
+    if tiles:
+        cache[key] = [str(t) for t in tiles]
+        try:
+            with open(cache_path, 'w') as f:
+                json.dump(cache, f, indent=2)
+        except OSError:
+            pass
+
+    return tiles
+
+
+def build_vrt(tiles: List[Path], output_vrt: Path) -> bool:
+    """
+    Create a virtual raster (VRT) that mosaics multiple raster tiles.
+    
+    Used for GMTED2010 tiles and for downloaded 3DEP DEM tiles. Uses
+    gdal.BuildVRT in-process when the GDAL Python bindings are installed,
+    otherwise falls back to the gdalbuildvrt command, and finally to
+    writing the VRT XML directly (write_mosaic_vrt).
+    
+    Args:
+        tiles: List of .tif files to mosaic
         output_vrt: Path where VRT should be saved
         
     Returns:
         True if successful, False otherwise
     """
-    if not gmted_tiles:
+    if not tiles:
         return False
 
+    if HAS_GDAL:
+        # Build in-process: no subprocess spawn or driver re-initialization
+        try:
+            gdal.SetConfigOption('GDAL_MAX_DATASET_POOL_SIZE',
+                                 GDAL_MAX_DATASET_POOL_SIZE)
+            ds = gdal.BuildVRT(
+                str(output_vrt), [str(t) for t in tiles],
+                options=gdal.BuildVRTOptions(resampleAlg='nearest'))
+            if ds is None:
+                print(f"  ✗ gdal.BuildVRT failed: {gdal.GetLastErrorMsg()}")
+                return False
+            ds.FlushCache()
+            ds = None
+            return True
+        except Exception as e:
+            print(f"  ✗ VRT creation error: {e}")
+            return False
+
     try:
-        cmd = ['gdalbuildvrt', str(output_vrt)] + [str(t) for t in gmted_tiles]
+        cmd = ['gdalbuildvrt', str(output_vrt)] + [str(t) for t in tiles]
 
         result = subprocess.run(cmd,
                                 capture_output=True,
@@ -174,32 +565,179 @@ def create_gmted_vrt(gmted_tiles: List[Path], output_vrt: Path) -> bool:
         print(f"  ✗ VRT creation timed out")
         return False
     except FileNotFoundError:
-        print(
-            f"  ✗ gdalbuildvrt not found. Install GDAL: sudo apt install gdal-bin"
-        )
+        print("  gdalbuildvrt not found, writing VRT directly...")
+        return write_mosaic_vrt(tiles, output_vrt)
+    except Exception as e:
+        print(f"  ✗ VRT creation error: {e}")
         return False
+
+
+# GDAL type names for VRT band dataType
+VRT_DATA_TYPES = {
+    'uint8': 'Byte',
+    'int8': 'Int8',
+    'uint16': 'UInt16',
+    'int16': 'Int16',
+    'uint32': 'UInt32',
+    'int32': 'Int32',
+    'float32': 'Float32',
+    'float64': 'Float64'
+}
+
+
+def write_mosaic_vrt(tiles: List[Path], output_vrt: Path) -> bool:
+    """
+    Write a mosaic VRT for tiles on a common grid without GDAL utilities.
+    
+    Reads only the tiles' headers with rasterio. The tiles must share CRS,
+    pixel size, band count and data type (as 3DEP and GMTED tiles do);
+    otherwise nothing is written.
+    
+    Args:
+        tiles: List of .tif files to mosaic
+        output_vrt: Path where VRT should be saved
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    import rasterio
+    from xml.sax.saxutils import escape
+
+    try:
+        infos = []
+        for tile in tiles:
+            with rasterio.open(tile) as src:
+                infos.append({
+                    'path': Path(tile).resolve(),
+                    'crs': src.crs,
+                    'res': src.res,
+                    'count': src.count,
+                    'dtype': src.dtypes[0],
+                    'nodata': src.nodata,
+                    'bounds': src.bounds,
+                    'width': src.width,
+                    'height': src.height,
+                    'north_up': src.transform.b == 0 and src.transform.d == 0
+                })
     except Exception as e:
         print(f"  ✗ VRT creation error: {e}")
         return False
 
+    first = infos[0]
+    res = first['res']
+    for info in infos:
+        same_grid = (info['crs'] == first['crs']
+                     and info['count'] == first['count']
+                     and info['dtype'] == first['dtype'] and info['north_up']
+                     and all(
+                         math.isclose(a, b, rel_tol=1e-9)
+                         for a, b in zip(info['res'], res)))
+        if not same_grid or info['dtype'] not in VRT_DATA_TYPES:
+            print("  ✗ Tiles are not on a common grid, cannot write VRT")
+            return False
+
+    left = min(info['bounds'].left for info in infos)
+    top = max(info['bounds'].top for info in infos)
+    right = max(info['bounds'].right for info in infos)
+    bottom = min(info['bounds'].bottom for info in infos)
+    nodata = first['nodata']
+
+    lines = [
+        f'<VRTDataset rasterXSize="{round((right - left) / res[0])}" '
+        f'rasterYSize="{round((top - bottom) / res[1])}">',
+        f'  <SRS>{escape(first["crs"].to_wkt())}</SRS>',
+        f'  <GeoTransform>{left!r}, {res[0]!r}, 0, {top!r}, 0, '
+        f'{-res[1]!r}</GeoTransform>'
+    ]
+    for band in range(1, first['count'] + 1):
+        lines.append(f'  <VRTRasterBand '
+                     f'dataType="{VRT_DATA_TYPES[first["dtype"]]}" '
+                     f'band="{band}">')
+        if nodata is not None:
+            lines.append(f'    <NoDataValue>{nodata!r}</NoDataValue>')
+
+        # ComplexSource honours each tile's nodata, so empty tile edges do
+        # not overwrite their neighbours
+        for info in infos:
+            x_off = round((info['bounds'].left - left) / res[0])
+            y_off = round((top - info['bounds'].top) / res[1])
+            size = f'xSize="{info["width"]}" ySize="{info["height"]}"'
+            lines.append('    <ComplexSource>')
+            lines.append(f'      <SourceFilename relativeToVRT="0">'
+                         f'{escape(str(info["path"]))}</SourceFilename>')
+            lines.append(f'      <SourceBand>{band}</SourceBand>')
+            lines.append(f'      <SrcRect xOff="0" yOff="0" {size}/>')
+            lines.append(
+                f'      <DstRect xOff="{x_off}" yOff="{y_off}" {size}/>')
+            if nodata is not None:
+                lines.append(f'      <NODATA>{nodata!r}</NODATA>')
+            lines.append('    </ComplexSource>')
+        lines.append('  </VRTRasterBand>')
+    lines.append('</VRTDataset>')
+
+    with open(output_vrt, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+    return True
+
+
+def boundary_bounds_4326(
+        state_boundary_path: Path) -> tuple[float, float, float, float]:
+    """
+    Get the state boundary's bounding box in EPSG:4326.
+    
+    Reads the extent from the layer metadata with pyogrio and reprojects only
+    its corners, instead of parsing and reprojecting every geometry. Falls
+    back to GeoPandas if pyogrio is not installed.
+    
+    Args:
+        state_boundary_path: Path to state boundary (FlatGeobuf or GeoJSON)
+        
+    Returns:
+        Tuple of (min_lon, min_lat, max_lon, max_lat)
+    """
+    try:
+        from pyogrio import read_info
+    except ImportError:
+        import geopandas as gpd
+        boundary = gpd.read_file(state_boundary_path)
+        return tuple(boundary.to_crs('EPSG:4326').total_bounds)
+
+    from pyproj import Transformer
+
+    info = read_info(str(state_boundary_path), force_total_bounds=True)
+    transformer = Transformer.from_crs(info['crs'] or 'EPSG:4326',
+                                       'EPSG:4326',
+                                       always_xy=True)
+    return transformer.transform_bounds(*info['total_bounds'])
+
 
 def extract_dem_from_gmted(gmted_dir: Path,
                            state_boundary_path: Path,
                            output_path: Path,
-                           variant: str = 'mea') -> bool:
+                           variant: str = 'mea',
+                           t_srs: Optional[str] = None,
+                           tr: Optional[float] = None,
+                           resampling: Optional[str] = None,
+                           num_threads: str = 'ALL_CPUS') -> bool:
     """
     Extract state DEM from GMTED2010 tiles.
     
     This will:
     1. Find which GMTED tiles cover the state
-    2. Create a VRT to mosaic them (if multiple)
+    2. Create a VRT to mosaic them (if multiple; in memory when the GDAL
+       Python bindings are available)
     3. Extract the state area using gdalwarp
     
     Args:
         gmted_dir: Path to GMTED2010 directory
-        state_boundary_path: Path to state boundary GeoJSON
+        state_boundary_path: Path to state boundary (FlatGeobuf or GeoJSON)
         output_path: Where to save extracted DEM
         variant: GMTED variant ('mea' for mean, 'med' for median, etc.)
+        t_srs: Optional target CRS to reproject to in the same pass
+        tr: Optional target resolution in target CRS units
+        resampling: Optional resampling method for reprojection
+        num_threads: Warp and compression threads ("ALL_CPUS" or a count)
         
     Returns:
         True if successful, False otherwise
@@ -208,12 +746,13 @@ def extract_dem_from_gmted(gmted_dir: Path,
         print(f"Extracting DEM from GMTED2010 ({variant} variant)...")
 
         # Get state bounds to find relevant tiles
-        import geopandas as gpd
-        boundary = gpd.read_file(state_boundary_path)
-        bounds_4326 = boundary.to_crs('EPSG:4326').total_bounds
+        min_lon, min_lat, max_lon, max_lat = boundary_bounds_4326(
+            state_boundary_path)
 
         # Find tiles
-        tiles = find_gmted_tiles(gmted_dir, tuple(bounds_4326), variant)
+        tiles = find_gmted_tiles_cached(gmted_dir, state_boundary_path,
+                                        (min_lon, min_lat, max_lon,
+                                         max_lat), variant)
 
         if not tiles:
             print(f"  ✗ No GMTED tiles found covering the state")
@@ -223,25 +762,46 @@ def extract_dem_from_gmted(gmted_dir: Path,
             f"  Found {len(tiles)} GMTED tile(s): {[t.parent.name for t in tiles]}"
         )
 
+        if HAS_GDAL:
+            # Mosaic into an in-memory VRT and warp it directly: no .vrt
+            # file is written and the XML is never re-parsed
+            if len(tiles) == 1:
+                source_raster = tiles[0]
+            else:
+                print(f"  Creating in-memory VRT mosaic...")
+                gdal.SetConfigOption('GDAL_MAX_DATASET_POOL_SIZE',
+                                     GDAL_MAX_DATASET_POOL_SIZE)
+                source_raster = gdal.BuildVRT('', [str(t) for t in tiles])
+                if source_raster is None:
+                    print(
+                        f"  ✗ gdal.BuildVRT failed: {gdal.GetLastErrorMsg()}"
+                    )
+                    return False
+
+            print(f"  Extracting state area...")
+            if not warp_in_process(source_raster, state_boundary_path,
+                                   output_path, t_srs, tr, resampling,
+                                   num_threads):
+                return False
+
+            print(f"  ✓ Extracted DEM to {output_path}")
+            return True
+
         # Create VRT if multiple tiles, or use single tile directly
         if len(tiles) == 1:
             source_raster = tiles[0]
         else:
             vrt_path = output_path.parent / f"{output_path.stem}_gmted.vrt"
             print(f"  Creating VRT mosaic...")
-            if not create_gmted_vrt(tiles, vrt_path):
+            if not build_vrt(tiles, vrt_path):
                 return False
             source_raster = vrt_path
 
         # Extract state area
         print(f"  Extracting state area...")
-        cmd = [
-            'gdalwarp', '-cutline',
-            str(state_boundary_path), '-crop_to_cutline', '-co',
-            'COMPRESS=LZW',
-            str(source_raster),
-            str(output_path)
-        ]
+        cmd = gdalwarp_command(source_raster, state_boundary_path,
+                               output_path, t_srs, tr, resampling,
+                               num_threads)
 
         result = subprocess.run(cmd,
                                 capture_output=True,
@@ -268,12 +828,112 @@ def extract_dem_from_gmted(gmted_dir: Path,
         return False
 
 
+def _ensure_dem(config, state_name: str, boundary_path: Path,
+                dem_path: Path, num_threads: str) -> Path | None:
+    """Extract the state DEM (GMTED2010 first, then local_file) if missing."""
+    if dem_path.exists():
+        return dem_path
+
+    dem_final = None
+
+    # Optional reprojection/resampling, applied during extraction
+    dem_warp = {
+        't_srs': config.get('cost_distance.terrain_data.dem.target_srs'),
+        'tr': config.get('cost_distance.terrain_data.dem.resolution'),
+        'resampling': config.get('cost_distance.terrain_data.dem.resampling'),
+        'num_threads': num_threads
+    }
+
+    # Try GMTED2010 first if available
+    gmted_dir_config = config.get('cost_distance.terrain_data.dem.gmted_dir')
+    if gmted_dir_config:
+        gmted_dir = Path(gmted_dir_config)
+        if gmted_dir.exists():
+            gmted_variant = config.get(
+                'cost_distance.terrain_data.dem.gmted_variant', 'mea')
+            print(
+                f"DEM not found for {state_name}, extracting from GMTED2010...")
+            if extract_dem_from_gmted(gmted_dir, boundary_path, dem_path,
+                                      gmted_variant, **dem_warp):
+                dem_final = dem_path
+            else:
+                print("  Warning: GMTED extraction failed")
+        else:
+            print(f"  Warning: GMTED directory not found: {gmted_dir}")
+
+    # Fall back to local_file if GMTED didn't work
+    if not dem_final:
+        local_dem = config.get('cost_distance.terrain_data.dem.local_file')
+        if local_dem:
+            local_dem_path = Path(local_dem)
+            if local_dem_path.exists():
+                print(
+                    f"DEM not found for {state_name}, extracting from {local_dem_path.name}..."
+                )
+                if extract_from_national_file(local_dem_path, boundary_path,
+                                              dem_path, **dem_warp):
+                    dem_final = dem_path
+                else:
+                    print(
+                        "  Warning: Extraction failed, continuing without DEM (flat terrain assumed)"
+                    )
+            else:
+                print(f"  Warning: Local DEM file not found: {local_dem}")
+                print("  Continuing without DEM (flat terrain assumed)")
+        else:
+            print(
+                f"  Warning: DEM not found for {state_name} and no source configured"
+            )
+            print("  Continuing without DEM (flat terrain assumed)")
+
+    return dem_final
+
+
+def _ensure_landcover(config, state_name: str, boundary_path: Path,
+                      landcover_path: Path, num_threads: str) -> Path | None:
+    """Extract the state land cover from the national file if missing."""
+    if landcover_path.exists():
+        return landcover_path
+
+    local_landcover = config.get(
+        'cost_distance.terrain_data.landcover.local_file')
+    if not local_landcover:
+        print(
+            f"  Warning: Land cover not found for {state_name} and no local source configured"
+        )
+        print("  Continuing without land cover (uniform cost)")
+        return None
+
+    local_lc_path = Path(local_landcover)
+    if not local_lc_path.exists():
+        print(f"  Warning: Local land cover file not found: {local_landcover}")
+        print("  Continuing without land cover (uniform cost)")
+        return None
+
+    print(
+        f"Land cover not found for {state_name}, extracting from {local_lc_path.name}..."
+    )
+    if extract_from_national_file(local_lc_path,
+                                  boundary_path,
+                                  landcover_path,
+                                  num_threads=num_threads):
+        return landcover_path
+
+    print(
+        "  Warning: Extraction failed, continuing without land cover (uniform cost)"
+    )
+    return None
+
+
 def ensure_terrain_data(config,
                         state_name: str) -> tuple[Path | None, Path | None]:
     """
     Ensure DEM and land cover exist for the state.
     Tries local extraction first if terrain data is missing.
     
+    DEM and land cover come from disjoint source files, so when both need
+    extracting they run concurrently, each with half of the CPU threads.
+    
     Args:
         config: Configuration object
         state_name: Name of state (e.g., "Utah")
@@ -290,109 +950,41 @@ def ensure_terrain_data(config,
 
     dem_path = state_folder / "dem.tif"
     landcover_path = state_folder / "landcover.tif"
-    boundary_path = state_folder / "boundary.geojson"
+    boundary_path = vector_path(state_folder, "boundary")
 
     if not boundary_path.exists():
         print(f"Warning: State boundary not found: {boundary_path}")
         print("Run 'fetch-data' first to download boundary")
         return None, None
 
-    # Check if DEM is enabled and needed
     dem_enabled = config.get('cost_distance.terrain_data.dem.enabled', True)
-    dem_final = None
-
-    if dem_enabled:
-        if not dem_path.exists():
-            # Try GMTED2010 first if available
-            gmted_dir_config = config.get(
-                'cost_distance.terrain_data.dem.gmted_dir')
-            if gmted_dir_config:
-                gmted_dir = Path(gmted_dir_config)
-                if gmted_dir.exists():
-                    gmted_variant = config.get(
-                        'cost_distance.terrain_data.dem.gmted_variant', 'mea')
-                    print(
-                        f"DEM not found for {state_name}, extracting from GMTED2010..."
-                    )
-                    if extract_dem_from_gmted(gmted_dir, boundary_path,
-                                              dem_path, gmted_variant):
-                        dem_final = dem_path
-                    else:
-                        print("  Warning: GMTED extraction failed")
-                else:
-                    print(f"  Warning: GMTED directory not found: {gmted_dir}")
-
-            # Fall back to local_file if GMTED didn't work
-            if not dem_final:
-                local_dem = config.get(
-                    'cost_distance.terrain_data.dem.local_file')
-                if local_dem:
-                    local_dem_path = Path(local_dem)
-                    if local_dem_path.exists():
-                        print(
-                            f"DEM not found for {state_name}, extracting from {local_dem_path.name}..."
-                        )
-                        if extract_from_national_file(local_dem_path,
-                                                      boundary_path, dem_path):
-                            dem_final = dem_path
-                        else:
-                            print(
-                                "  Warning: Extraction failed, continuing without DEM (flat terrain assumed)"
-                            )
-                    else:
-                        print(
-                            f"  Warning: Local DEM file not found: {local_dem}"
-                        )
-                        print(
-                            "  Continuing without DEM (flat terrain assumed)")
-                else:
-                    print(
-                        f"  Warning: DEM not found for {state_name} and no source configured"
-                    )
-                    print("  Continuing without DEM (flat terrain assumed)")
-        else:
-            dem_final = dem_path
-    else:
-        print("DEM disabled in config, assuming flat terrain")
-
-    # Check if land cover is enabled and needed
     landcover_enabled = config.get(
         'cost_distance.terrain_data.landcover.enabled', True)
-    landcover_final = None
-
-    if landcover_enabled:
-        if not landcover_path.exists():
-            # Try local extraction first
-            local_landcover = config.get(
-                'cost_distance.terrain_data.landcover.local_file')
-            if local_landcover:
-                local_lc_path = Path(local_landcover)
-                if local_lc_path.exists():
-                    print(
-                        f"Land cover not found for {state_name}, extracting from {local_lc_path.name}..."
-                    )
-                    if extract_from_national_file(local_lc_path, boundary_path,
-                                                  landcover_path):
-                        landcover_final = landcover_path
-                    else:
-                        print(
-                            "  Warning: Extraction failed, continuing without land cover (uniform cost)"
-                        )
-                else:
-                    print(
-                        f"  Warning: Local land cover file not found: {local_landcover}"
-                    )
-                    print("  Continuing without land cover (uniform cost)")
-            else:
-                print(
-                    f"  Warning: Land cover not found for {state_name} and no local source configured"
-                )
-                print("  Continuing without land cover (uniform cost)")
-        else:
-            landcover_final = landcover_path
-    else:
+
+    if not dem_enabled:
+        print("DEM disabled in config, assuming flat terrain")
+    if not landcover_enabled:
         print("Land cover disabled in config, using uniform cost")
 
+    # Split threads between the two warps to avoid oversubscription
+    concurrent = (dem_enabled and not dem_path.exists() and landcover_enabled
+                  and not landcover_path.exists())
+    num_threads = (str(max(1, (os.cpu_count() or 2) // 2))
+                   if concurrent else 'ALL_CPUS')
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        dem_future = (executor.submit(_ensure_dem, config, state_name,
+                                      boundary_path, dem_path, num_threads)
+                      if dem_enabled else None)
+        landcover_future = (executor.submit(_ensure_landcover, config,
+                                            state_name, boundary_path,
+                                            landcover_path, num_threads)
+                            if landcover_enabled else None)
+
+        dem_final = dem_future.result() if dem_future else None
+        landcover_final = (landcover_future.result()
+                           if landcover_future else None)
+
     return dem_final, landcover_final
 
 
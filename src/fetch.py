@@ -9,23 +9,109 @@ This module handles:
 - Downloading land cover from NLCD
 """
 import gc
+import json
+import math
 import os
 import shutil
 import tempfile
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
 import geopandas as gpd
+import numpy as np
 import osmnx as ox
 import pandas as pd
 import rasterio
 import requests
+import shapely
+from rasterio.enums import Resampling
+from rasterio.features import geometry_mask
 from rasterio.mask import mask
-from rasterio.merge import merge
+from rasterio.transform import Affine
+from rasterio.windows import bounds as window_bounds
+from rasterio.windows import from_bounds
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 
 from .config import get_config
+from .extract_terrain import build_vrt
+from .vector_io import (HAS_PYARROW, HAS_PYOGRIO, read_vector, vector_path,
+                        write_vector)
+
+
+try:
+    from ujson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# ox.settings is module-global; fetchers running in threads set it under
+# this lock
+_OSMNX_SETTINGS_LOCK = threading.Lock()
+
+# highway values excluded when no road types are configured (mirrors the
+# OSMnx "drive" network filter)
+NON_DRIVE_HIGHWAY_TYPES = [
+    'abandoned', 'bridleway', 'bus_guideway', 'construction', 'corridor',
+    'cycleway', 'elevator', 'escalator', 'footway', 'no', 'path',
+    'pedestrian', 'planned', 'platform', 'proposed', 'raceway', 'razed',
+    'steps', 'track'
+]
+
+# Creation options for clipped DEM/land cover: 512x512 tiles so later stages
+# read blocks instead of whole scanlines, and multi-threaded ZSTD
+RASTER_WRITE_OPTIONS = {
+    'tiled': True,
+    'blockxsize': 512,
+    'blockysize': 512,
+    'compress': 'zstd',
+    'zstd_level': 3,
+    'bigtiff': 'IF_SAFER'
+}
+
+
+def raster_write_options(dtype, categorical: bool = False) -> dict:
+    """
+    Get GeoTIFF creation options for a clipped raster.
+    
+    Args:
+        dtype: Raster data type
+        categorical: True for class codes (e.g., NLCD), where a predictor
+            does not help but a higher ZSTD level pays off (long runs of
+            few values, written once and read often)
+        
+    Returns:
+        Dictionary of rasterio creation options
+    """
+    if categorical:
+        return {**RASTER_WRITE_OPTIONS, 'predictor': 1, 'zstd_level': 9}
+
+    if np.issubdtype(np.dtype(dtype), np.floating):
+        predictor = 3
+    else:
+        predictor = 2
+
+    return {**RASTER_WRITE_OPTIONS, 'predictor': predictor}
+
+
+def add_overviews(path: Path, categorical: bool = False):
+    """
+    Build internal overviews (2x to 32x) for a written GeoTIFF.
+    
+    Args:
+        path: GeoTIFF to update in place
+        categorical: True for class codes, which are resampled by mode
+            instead of averaged
+    """
+    resampling = Resampling.mode if categorical else Resampling.average
+
+    with rasterio.Env(GDAL_NUM_THREADS='ALL_CPUS'):
+        with rasterio.open(path, 'r+') as dst:
+            dst.build_overviews([2, 4, 8, 16, 32], resampling)
+            dst.update_tags(ns='rio_overview', resampling=resampling.name)
 
 
 class DataFetcher:
@@ -41,6 +127,148 @@ class DataFetcher:
         self.config = config or get_config()
         self.config.ensure_directories()
 
+        # Shared session: pooled keep-alive connections plus retry/backoff
+        # on transient errors and rate limiting
+        retry = Retry(total=5,
+                      backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504],
+                      respect_retry_after_header=True)
+        adapter = HTTPAdapter(pool_connections=16,
+                              pool_maxsize=16,
+                              max_retries=retry)
+        self._session = requests.Session()
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+        # Reprojected boundaries, keyed by (id(boundary), CRS)
+        self._boundary_cache = {}
+
+        # Overpass allows few concurrent requests per IP; every Overpass
+        # query (road chunks, settlements) takes a slot
+        self._overpass_slots = threading.Semaphore(
+            self.config.get('data.overpass_workers', 2))
+
+    def _configure_osmnx(self):
+        """Point OSMnx at this state's HTTP cache (settings are global)."""
+        state_folder = (self.config.get_path('raw_data') /
+                        self.config.state_name.lower())
+        with _OSMNX_SETTINGS_LOCK:
+            ox.settings.use_cache = True
+            ox.settings.cache_folder = str(state_folder / '.osmnx_cache')
+            ox.settings.log_console = True
+            ox.settings.requests_timeout = 600
+
+    def _boundary_in_crs(self, boundary: gpd.GeoDataFrame,
+                         crs) -> gpd.GeoDataFrame:
+        """
+        Reproject the boundary, reusing earlier results for the same CRS.
+        
+        fetch_all passes the same boundary to every fetch step, so the
+        (full-resolution) state polygon is reprojected once per CRS rather
+        than once per step.
+        
+        Args:
+            boundary: Boundary GeoDataFrame
+            crs: Target CRS (anything accepted by to_crs)
+            
+        Returns:
+            Boundary in the target CRS
+        """
+        key = (id(boundary), str(crs))
+        cached = self._boundary_cache.get(key)
+
+        # Keep a reference to the source so its id cannot be reused
+        if cached is None or cached[0] is not boundary:
+            # A new boundary (e.g. another state) replaces the old entries
+            # instead of keeping every reprojected copy alive
+            if any(entry[0] is not boundary
+                   for entry in self._boundary_cache.values()):
+                self._boundary_cache.clear()
+
+            cached = (boundary, boundary.to_crs(crs))
+            self._boundary_cache[key] = cached
+
+        return cached[1]
+
+    def _download_cached(self, url: str, dest: Path) -> Path:
+        """
+        Download a file once, re-downloading only if the server copy changed.
+        
+        The ETag and Content-Length of the last download are kept in a
+        sidecar <dest>.meta.json and sent back as If-None-Match, so an
+        unchanged file costs a single conditional request.
+        
+        Args:
+            url: URL to download
+            dest: Local cache path
+            
+        Returns:
+            Path to the cached file
+        """
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        meta_path = dest.with_name(dest.name + '.meta.json')
+
+        meta = {}
+        if dest.exists() and meta_path.exists():
+            try:
+                with open(meta_path, 'r') as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                meta = {}
+
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+
+        try:
+            response = self._session.get(url,
+                                         stream=True,
+                                         headers=headers,
+                                         timeout=60)
+        except requests.RequestException:
+            if dest.exists():
+                print(f"Could not reach {url}, using cached {dest.name}")
+                return dest
+            raise
+
+        with response:
+            if response.status_code == 304:
+                print(f"Using cached {dest.name}")
+                return dest
+
+            response.raise_for_status()
+
+            total_size = int(response.headers.get('content-length', 0))
+            if (dest.exists() and total_size
+                    and meta.get('content_length') == total_size
+                    and not meta.get('etag')):
+                print(f"Using cached {dest.name}")
+                return dest
+
+            # Copy the socket to disk in 1 MiB reads; the progress bar
+            # counts the bytes written
+            tmp_path = dest.with_name(dest.name + '.part')
+            response.raw.decode_content = True
+            try:
+                with open(tmp_path, 'wb') as raw, tqdm.wrapattr(
+                        raw, 'write', total=total_size, unit='B',
+                        unit_scale=True) as f:
+                    shutil.copyfileobj(response.raw, f, length=1 << 20)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            tmp_path.replace(dest)
+
+            with open(meta_path, 'w') as f:
+                json.dump(
+                    {
+                        'url': url,
+                        'etag': response.headers.get('ETag'),
+                        'content_length': total_size
+                    }, f)
+
+        return dest
+
     def fetch_state_boundary(self,
                              state_name: Optional[str] = None
                              ) -> gpd.GeoDataFrame:
@@ -64,28 +292,48 @@ class DataFetcher:
         state_folder = self.config.get_path('raw_data') / state_name.lower()
         state_folder.mkdir(parents=True, exist_ok=True)
 
-        output_path = state_folder / "boundary.geojson"
+        output_path = vector_path(state_folder, "boundary")
 
         # Check if already exists
         if output_path.exists():
             print(f"Boundary already exists at {output_path}")
-            gdf = gpd.read_file(output_path)
+            gdf = read_vector(output_path)
             return gdf
 
         try:
-            # Download and filter
+            # Download once into the shared cache (reused across states)
             print(f"Downloading from {url}...")
-            gdf = gpd.read_file(url)
+            zip_path = self._download_cached(
+                url,
+                self.config.get_path('raw_data') / '.cache' /
+                url.rsplit('/', 1)[-1])
+            source = f"zip://{zip_path}!{zip_path.stem}.shp"
+
+            # Filter to the state during the read so only its geometry is
+            # parsed (pyogrio pushes the filter down to OGR; ILIKE is OGR
+            # SQL's case-insensitive comparison)
+            if HAS_PYOGRIO:
+                state_key = state_name.replace("'", "''")
+                state_gdf = gpd.read_file(
+                    source,
+                    engine='pyogrio',
+                    where=f"NAME ILIKE '{state_key}'")
+            else:
+                # pyogrio unavailable: read everything and filter afterwards
+                gdf = gpd.read_file(source)
 
-            # Filter to specific state
-            state_gdf = gdf[gdf['NAME'].str.upper() ==
-                            state_name.upper()].copy()
+                # Compare on the (few) distinct names, then match by code
+                names = gdf['NAME'].astype('category')
+                matches = (names.cat.categories.str.casefold() ==
+                           state_name.casefold())
+                codes = matches.nonzero()[0]
+                state_gdf = gdf[names.cat.codes.isin(codes).values]
 
             if len(state_gdf) == 0:
                 raise ValueError(f"State '{state_name}' not found in dataset")
 
             # Save to file
-            state_gdf.to_file(output_path, driver='GeoJSON')
+            write_vector(state_gdf, output_path)
             print(f"Saved boundary to {output_path}")
 
             return state_gdf
@@ -94,168 +342,468 @@ class DataFetcher:
             print(f"Error fetching state boundary: {e}")
             raise
 
-    def _fetch_roads_simple(self, polygon, road_filter):
-        """Fetch roads in a single query (for small states)."""
-        if road_filter:
-            G = ox.graph_from_polygon(polygon,
-                                      network_type='drive',
-                                      custom_filter=road_filter,
-                                      simplify=True)
-        else:
-            G = ox.graph_from_polygon(polygon,
-                                      network_type='drive',
-                                      simplify=True)
+    @staticmethod
+    def _fetch_road_features(polygon, road_types) -> gpd.GeoDataFrame:
+        """
+        Fetch road ways inside a polygon as a GeoDataFrame.
+        
+        Uses ox.features_from_polygon, which returns way geometries directly
+        without assembling a routing graph (topology is never used here).
+        
+        Args:
+            polygon: Query polygon in EPSG:4326
+            road_types: List of highway values to keep, or None for all
+                drivable types
+            
+        Returns:
+            GeoDataFrame with geometry, highway and (if present) name
+        """
+        tags = {'highway': list(road_types) if road_types else True}
+        features = ox.features_from_polygon(polygon, tags=tags)
 
-        print(f"Downloaded {len(G.edges):,} edges")
+        # Keep ways only (drop e.g. traffic-signal nodes and areas)
+        is_line = np.isin(features.geom_type.values,
+                          ['LineString', 'MultiLineString'])
+        features = features[is_line]
 
-        # Convert to GeoDataFrame
-        edges = ox.graph_to_gdfs(G, nodes=False, edges=True)
+        if not road_types:
+            features = features[~features['highway'].
+                                isin(NON_DRIVE_HIGHWAY_TYPES).values]
 
         # Keep only essential columns
-        essential_cols = ['geometry', 'highway', 'length']
-        if 'name' in edges.columns:
+        essential_cols = ['geometry', 'highway']
+        if 'name' in features.columns:
             essential_cols.append('name')
-        edges = edges[[col for col in essential_cols if col in edges.columns]]
+        return features[essential_cols].reset_index(drop=True)
+
+    @staticmethod
+    def _overpass_road_query(polygon, road_types, out='geom') -> str:
+        """
+        Build one Overpass QL query for all roads inside a polygon.
+        
+        The polygon is slightly buffered and simplified so the query stays
+        small; results are clipped to the exact boundary afterwards.
+        
+        Args:
+            polygon: (Multi)Polygon in EPSG:4326
+            road_types: List of highway values, or None for drivable types
+            out: Overpass output mode ("geom" for ways with coordinates,
+                "count" for element counts only)
+            
+        Returns:
+            Overpass QL query string
+        """
+        if road_types:
+            way_filter = '["highway"~"^(' + '|'.join(road_types) + ')$"]'
+        else:
+            way_filter = ('["highway"]["highway"!~"^(' +
+                          '|'.join(NON_DRIVE_HIGHWAY_TYPES) + ')$"]')
+
+        query_area = polygon.buffer(0.01).simplify(0.005)
+        parts = getattr(query_area, 'geoms', [query_area])
+
+        statements = []
+        for part in parts:
+            coords = ' '.join(f"{lat:.5f} {lon:.5f}"
+                              for lon, lat in part.exterior.coords)
+            statements.append(f'way{way_filter}(poly:"{coords}");')
+
+        return ('[out:json][timeout:300];(' + ''.join(statements) +
+                f');out {out};')
+
+    def _count_road_ways(self, polygon, road_types) -> int:
+        """
+        Count the road ways inside a polygon with one Overpass count query.
+        
+        Returns:
+            Number of ways (no geometry is transferred)
+        """
+        url = self.config.get('data.overpass_url',
+                              'https://overpass-api.de/api/interpreter')
+        query = self._overpass_road_query(polygon, road_types, out='count')
+
+        with self._overpass_slots:
+            response = self._session.post(url,
+                                          data={'data': query},
+                                          timeout=330)
+        response.raise_for_status()
+
+        for element in json_loads(response.content).get('elements', []):
+            if element.get('type') == 'count':
+                return int(element['tags']['ways'])
+
+        raise RuntimeError("Overpass returned no count")
+
+    def _fetch_roads_simple(self, polygon, road_types):
+        """
+        Fetch roads in a single bulk Overpass query (for small states).
+        
+        Ways are requested with their geometry inline (out geom) and turned
+        into LineStrings directly, with no graph or node lookup.
+        """
+        url = self.config.get('data.overpass_url',
+                              'https://overpass-api.de/api/interpreter')
+        query = self._overpass_road_query(polygon, road_types)
+
+        with self._overpass_slots:
+            response = self._session.post(url,
+                                          data={'data': query},
+                                          timeout=330)
+        response.raise_for_status()
+
+        result = json_loads(response.content)
+        remark = result.get('remark', '')
+        if 'runtime error' in remark:
+            raise RuntimeError(f"Overpass query failed: {remark}")
+
+        ways = [
+            el for el in result.get('elements', [])
+            if el.get('type') == 'way' and len(el.get('geometry', [])) >= 2
+        ]
+
+        # Build all LineStrings in one vectorized call
+        coords = np.array([(pt['lon'], pt['lat']) for way in ways
+                           for pt in way['geometry']],
+                          dtype=np.float64).reshape(-1, 2)
+        indices = np.repeat(np.arange(len(ways)),
+                            [len(way['geometry']) for way in ways])
+        geometries = shapely.linestrings(coords, indices=indices)
+
+        tags = [way.get('tags', {}) for way in ways]
+        edges = gpd.GeoDataFrame(
+            {
+                'highway': [t.get('highway') for t in tags],
+                'name': [t.get('name') for t in tags]
+            },
+            geometry=geometries,
+            crs='EPSG:4326')
+
+        # Clip to the exact state boundary
+        edges = edges[shapely.intersects(np.asarray(edges.geometry.array),
+                                         polygon)].reset_index(drop=True)
+
+        print(f"Downloaded {len(edges):,} road ways")
 
         return edges
 
-    def _fetch_roads_chunked(self, polygon, road_filter, boundary_gdf):
+    def _fetch_chunk(self,
+                     chunk_box,
+                     road_types,
+                     state_poly,
+                     label,
+                     overpass_slots=None):
+        """
+        Fetch and clip the roads for one grid chunk.
+        
+        Args:
+            overpass_slots: Optional semaphore bounding concurrent Overpass
+                requests (parsing and clipping run outside it)
+        
+        Returns:
+            GeoDataFrame of roads in the chunk, or None if empty or failed
+        """
+        try:
+            if overpass_slots is not None:
+                with overpass_slots:
+                    print(f"Chunk {label}: Fetching...")
+                    chunk_edges = self._fetch_road_features(
+                        chunk_box, road_types)
+            else:
+                print(f"Chunk {label}: Fetching...")
+                chunk_edges = self._fetch_road_features(chunk_box, road_types)
+
+            if len(chunk_edges) == 0:
+                print(f"Chunk {label}: No roads found")
+                return None
+
+            # Clip to state boundary: one GIL-free Shapely call over the
+            # geometry array against the prepared state polygon
+            inside = shapely.intersects(np.asarray(chunk_edges.geometry.array),
+                                        state_poly)
+            chunk_edges = chunk_edges[inside]
+
+            print(f"Chunk {label}: Got {len(chunk_edges):,} roads")
+            return chunk_edges
+
+        except Exception as e:
+            print(f"Chunk {label}: Failed ({e}), skipping...")
+            return None
+
+    def _fetch_roads_chunked(self,
+                             polygon,
+                             road_types,
+                             boundary_gdf,
+                             output_path=None):
         """
         Fetch roads in geographic chunks to prevent memory issues.
         
         Divides the state into a grid and fetches roads for each cell separately.
-        This prevents memory exhaustion on dense road networks.
+        This prevents memory exhaustion on dense road networks. Chunk queries
+        are latency-bound, so several run concurrently
+        (data.fetch_workers, default 4).
+
+        If output_path is a .parquet file (pyarrow installed), each chunk is
+        appended to it as soon as it arrives, so only one chunk is held in
+        memory; the file is written as <output_path>.part and renamed when
+        all chunks are done.
         """
         import gc
 
-        from shapely.geometry import box
-
         # Get bounding box
         bounds = boundary_gdf.total_bounds  # [minx, miny, maxx, maxy]
 
-        # Determine grid size based on state area
         width = bounds[2] - bounds[0]
         height = bounds[3] - bounds[1]
-        area = width * height
 
-        # Adaptive grid size: larger states get more chunks
-        if area > 20:  # Very large state (e.g., Texas, California)
-            grid_size = 6
-        elif area > 10:  # Large state (e.g., Nevada, Montana)
-            grid_size = 4
-        else:  # Medium state (e.g., Pennsylvania, Georgia)
-            grid_size = 3
+        # Size the grid by road density: one cheap count query, then enough
+        # chunks to keep each under data.ways_per_chunk ways
+        ways_per_chunk = self.config.get('data.ways_per_chunk', 500000)
+        try:
+            ways = self._count_road_ways(polygon, road_types)
+            grid_size = max(1, math.ceil(math.sqrt(ways / ways_per_chunk)))
+            print(f"Overpass reports {ways:,} road ways")
+        except Exception as e:
+            print(f"Road count failed ({e}), sizing grid by area...")
+            area = width * height
+
+            # Adaptive grid size: larger states get more chunks
+            if area > 20:  # Very large state (e.g., Texas, California)
+                grid_size = 6
+            elif area > 10:  # Large state (e.g., Nevada, Montana)
+                grid_size = 4
+            else:  # Medium state (e.g., Pennsylvania, Georgia)
+                grid_size = 3
 
         print(
             f"Dividing into {grid_size}×{grid_size} grid ({grid_size**2} chunks)"
         )
 
-        # Create grid cells
+        # Create grid cells as arrays (row-major, same numbering as before)
         x_step = width / grid_size
         y_step = height / grid_size
 
-        all_edges = []
+        rows, cols = np.divmod(np.arange(grid_size**2), grid_size)
+        cell_boxes = shapely.box(bounds[0] + cols * x_step,
+                                 bounds[1] + rows * y_step,
+                                 bounds[0] + (cols + 1) * x_step,
+                                 bounds[1] + (rows + 1) * y_step)
+
+        # Prepare the state polygon once: the cell-skip test and every
+        # chunk's clip (vectorized intersects) then use its GEOS index
+        # instead of re-traversing all vertices. The cell test below runs
+        # before the workers start, so the index is built before threads
+        # share it.
+        state_poly = boundary_gdf.geometry.iloc[0]
+        shapely.prepare(state_poly)
+
+        # Check all cells against the state boundary in one call
+        inside = shapely.intersects(state_poly, cell_boxes)
+        chunks = []
+
+        for idx in range(grid_size**2):
+            chunk_num = idx + 1
+            if not inside[idx]:
+                print(
+                    f"Chunk {chunk_num}/{grid_size**2}: Skipping (outside state)"
+                )
+                continue
+
+            chunks.append((cell_boxes[idx], f"{chunk_num}/{grid_size**2}"))
+
+        # Roads crossing a grid line can come back from several chunks; only
+        # those are remembered for deduplication
+        seen_border = set()
+        border = shapely.multilinestrings(
+            [[(bounds[0] + k * x_step, bounds[1]),
+              (bounds[0] + k * x_step, bounds[3])]
+             for k in range(1, grid_size)] +
+            [[(bounds[0], bounds[1] + k * y_step),
+              (bounds[2], bounds[1] + k * y_step)]
+             for k in range(1, grid_size)]) if grid_size > 1 else None
+
+        # Fetch roads for the chunks concurrently. Finished chunks are either
+        # appended to a GeoParquet file as they arrive (output_path), or
+        # folded into a running frame every concat_every chunks so that only
+        # a few chunk frames are alive at once.
+        # The downloads themselves are gated by the Overpass slots,
+        # separately from the worker pool
+        max_workers = self.config.get('data.fetch_workers', 4)
+        concat_every = 4
+        combined = None
+        pending = []
         successful_chunks = 0
+        removed = 0
 
-        for i in range(grid_size):
-            for j in range(grid_size):
-                chunk_num = i * grid_size + j + 1
+        stream = output_path is not None and Path(
+            output_path).suffix == '.parquet' and HAS_PYARROW
+        writer = None
+        part_path = Path(f"{output_path}.part") if stream else None
 
-                # Create chunk bounding box
-                minx = bounds[0] + j * x_step
-                maxx = bounds[0] + (j + 1) * x_step
-                miny = bounds[1] + i * y_step
-                maxy = bounds[1] + (i + 1) * y_step
-
-                chunk_box = box(minx, miny, maxx, maxy)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._fetch_chunk, chunk_box, road_types,
+                                    state_poly, label, self._overpass_slots)
+                    for chunk_box, label in chunks
+                ]
+
+                for future in as_completed(futures):
+                    chunk_edges = future.result()
+                    if chunk_edges is None:
+                        continue
 
-                # Check if chunk intersects state boundary
-                state_poly = boundary_gdf.geometry.iloc[0]
-                if not chunk_box.intersects(state_poly):
-                    print(
-                        f"Chunk {chunk_num}/{grid_size**2}: Skipping (outside state)"
-                    )
-                    continue
+                    count = len(chunk_edges)
+                    chunk_edges = self._drop_seen_roads(
+                        chunk_edges, border, seen_border)
+                    removed += count - len(chunk_edges)
+                    successful_chunks += 1
 
-                # Fetch roads for this chunk
-                try:
-                    print(f"Chunk {chunk_num}/{grid_size**2}: Fetching...")
-
-                    if road_filter:
-                        G = ox.graph_from_polygon(chunk_box,
-                                                  network_type='drive',
-                                                  custom_filter=road_filter,
-                                                  simplify=True)
-                    else:
-                        G = ox.graph_from_polygon(chunk_box,
-                                                  network_type='drive',
-                                                  simplify=True)
-
-                    if len(G.edges) == 0:
-                        print(
-                            f"Chunk {chunk_num}/{grid_size**2}: No roads found"
-                        )
+                    if stream:
+                        writer = self._write_roads_chunk(
+                            writer, part_path, chunk_edges)
+                        del chunk_edges
                         continue
 
-                    # Convert to GeoDataFrame
-                    chunk_edges = ox.graph_to_gdfs(G, nodes=False, edges=True)
+                    pending.append(chunk_edges)
+                    del chunk_edges
+
+                    if len(pending) >= concat_every:
+                        parts = [combined] if combined is not None else []
+                        combined = pd.concat(parts + pending,
+                                             ignore_index=True)
+                        pending.clear()
+                        gc.collect()
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if successful_chunks == 0:
+            if part_path is not None and part_path.exists():
+                part_path.unlink()
+            raise RuntimeError("No roads fetched successfully")
 
-                    # Keep only essential columns
-                    essential_cols = ['geometry', 'highway', 'length']
-                    if 'name' in chunk_edges.columns:
-                        essential_cols.append('name')
-                    chunk_edges = chunk_edges[[
-                        col for col in essential_cols
-                        if col in chunk_edges.columns
-                    ]]
+        print(f"Successfully fetched {successful_chunks} chunks")
+        if removed > 0:
+            print(f"Removed {removed:,} duplicate roads between chunks")
 
-                    # Clip to state boundary
-                    chunk_edges = chunk_edges[chunk_edges.geometry.intersects(
-                        state_poly)]
+        if stream:
+            os.replace(part_path, output_path)
+            print(f"Saved roads to {output_path}")
+            return read_vector(output_path)
 
-                    print(
-                        f"Chunk {chunk_num}/{grid_size**2}: Got {len(chunk_edges):,} roads"
-                    )
+        # Combine remaining chunks
+        parts = [combined] if combined is not None else []
+        combined = gpd.GeoDataFrame(pd.concat(parts + pending,
+                                              ignore_index=True))
+        pending.clear()
 
-                    all_edges.append(chunk_edges)
-                    successful_chunks += 1
+        return combined
 
-                    # Force garbage collection after each chunk
-                    del G, chunk_edges
-                    gc.collect()
+    @staticmethod
+    def _drop_seen_roads(chunk_edges, border, seen_border):
+        """
+        Drop roads already returned by another chunk.
 
-                except Exception as e:
-                    print(
-                        f"Chunk {chunk_num}/{grid_size**2}: Failed ({e}), skipping..."
-                    )
-                    continue
+        A road can only be in two chunks if it crosses a grid line, so only
+        those roads' WKB is kept in seen_border (called from the consuming
+        thread only).
 
-        if not all_edges:
-            raise RuntimeError("No roads fetched successfully")
+        Returns:
+            chunk_edges without duplicates
+        """
+        if border is None:
+            return chunk_edges
 
-        print(f"Successfully fetched {successful_chunks} chunks, combining...")
+        geoms = np.asarray(chunk_edges.geometry.array)
+        on_border = np.flatnonzero(shapely.intersects(geoms, border))
+        keep = np.ones(len(geoms), dtype=bool)
 
-        # Combine all chunks
-        combined = gpd.GeoDataFrame(pd.concat(all_edges, ignore_index=True))
+        for i, wkb in zip(on_border, shapely.to_wkb(geoms[on_border])):
+            if wkb in seen_border:
+                keep[i] = False
+            else:
+                seen_border.add(wkb)
 
-        # Remove duplicates (roads that appear in multiple chunks)
-        print("Removing duplicate roads between chunks...")
-        original_count = len(combined)
-        combined = combined.drop_duplicates(subset=['geometry'])
-        removed = original_count - len(combined)
-        if removed > 0:
-            print(f"Removed {removed:,} duplicates")
+        return chunk_edges if keep.all() else chunk_edges[keep]
 
-        return combined
+    @staticmethod
+    def _write_roads_chunk(writer, path, chunk_edges):
+        """
+        Append one chunk of roads to a GeoParquet file.
+
+        Args:
+            writer: Open pyarrow ParquetWriter, or None for the first chunk
+            path: Destination file (created with the first chunk)
+            chunk_edges: GeoDataFrame of roads
 
-    def fetch_roads(
-            self,
-            boundary: Optional[gpd.GeoDataFrame] = None) -> gpd.GeoDataFrame:
+        Returns:
+            The ParquetWriter
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # Same columns in every chunk; all-missing names become nulls
+        chunk_edges = chunk_edges.reindex(
+            columns=['highway', 'name', 'geometry'])
+        geometry = chunk_edges.geometry.to_numpy()
+        frame = pd.DataFrame({
+            'highway': chunk_edges['highway'],
+            'name': chunk_edges['name'].astype(object).where(
+                chunk_edges['name'].notna(), None),
+            'geometry': shapely.to_wkb(geometry)
+        })
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+
+        # Per-row bbox covering column: each chunk is one spatial cell, so
+        # row group statistics let bbox reads skip whole chunks
+        bounds = shapely.bounds(geometry)
+        table = table.append_column('bbox', pa.StructArray.from_arrays(
+            [pa.array(bounds[:, i]) for i in range(4)],
+            names=['xmin', 'ymin', 'xmax', 'ymax']))
+
+        if writer is None:
+            # GeoParquet "geo" metadata; the file-level bbox and geometry
+            # types are left out since the first chunk cannot describe the
+            # whole file
+            geometry_meta = {
+                'encoding': 'WKB',
+                'geometry_types': [],
+                'covering': {
+                    'bbox': {
+                        key: ['bbox', key]
+                        for key in ('xmin', 'ymin', 'xmax', 'ymax')
+                    }
+                }
+            }
+            if chunk_edges.crs is not None:
+                geometry_meta['crs'] = chunk_edges.crs.to_json_dict()
+            geo = {
+                'version': '1.1.0',
+                'primary_column': 'geometry',
+                'columns': {'geometry': geometry_meta}
+            }
+
+            schema = pa.schema([
+                pa.field('highway', pa.string()),
+                pa.field('name', pa.string()),
+                pa.field('geometry', pa.binary()),
+                table.schema.field('bbox')
+            ], metadata={b'geo': json.dumps(geo).encode()})
+            writer = pq.ParquetWriter(str(path), schema)
+
+        writer.write_table(table.cast(writer.schema))
+        return writer
+
+    def fetch_roads(self,
+                    boundary: Optional[gpd.GeoDataFrame] = None,
+                    bbox: Optional[tuple] = None) -> gpd.GeoDataFrame:
         """
         Fetch road network from OpenStreetMap.
         
         Args:
             boundary: GeoDataFrame with boundary polygon. If None, fetches it first.
+            bbox: Optional (minx, miny, maxx, maxy) in EPSG:4326 to load only
+                part of already-fetched roads
             
         Returns:
             GeoDataFrame with road network
@@ -269,19 +817,19 @@ class DataFetcher:
         state_folder = self.config.get_path('raw_data') / state_name.lower()
         state_folder.mkdir(parents=True, exist_ok=True)
 
-        output_path = state_folder / "roads.geojson"
+        output_path = vector_path(state_folder, "roads", columnar=True)
 
         # Check if already exists
         if output_path.exists():
             print(f"Roads already exist at {output_path}")
-            return gpd.read_file(output_path)
+            return read_vector(output_path, bbox=bbox)
 
         print(f"Fetching roads for {state_name} from OpenStreetMap...")
         print("This may take several minutes...")
 
         try:
             # Get the geometry in WGS84 for OSMnx
-            boundary_wgs84 = boundary.to_crs('EPSG:4326')
+            boundary_wgs84 = self._boundary_in_crs(boundary, 'EPSG:4326')
             polygon = boundary_wgs84.geometry.iloc[0]
 
             # Calculate state size to determine fetching strategy
@@ -292,33 +840,37 @@ class DataFetcher:
             # Dense eastern states or large western states need this
             use_chunks = area_deg2 > 5.0  # ~5 degree² = need chunking
 
-            # Configure OSMnx
-            ox.settings.use_cache = True
-            ox.settings.log_console = True
+            self._configure_osmnx()
 
-            # Build road type filter
+            # Road types to include (None = all drivable types)
             road_types = self.config.road_types
-            if road_types:
-                road_filter = '["highway"~"' + '|'.join(road_types) + '"]'
-            else:
-                road_filter = None
 
             if use_chunks:
                 print(
                     f"State is large (area={area_deg2:.1f}°²), using chunked fetching to prevent memory issues..."
                 )
-                edges = self._fetch_roads_chunked(polygon, road_filter,
-                                                  boundary_wgs84)
+                edges = self._fetch_roads_chunked(polygon, road_types,
+                                                  boundary_wgs84, output_path)
             else:
                 print("Fetching roads in single query...")
-                edges = self._fetch_roads_simple(polygon, road_filter)
+                try:
+                    edges = self._fetch_roads_simple(polygon, road_types)
+                except Exception as e:
+                    # e.g. 504 / out-of-memory on the Overpass server
+                    print(
+                        f"Single query failed ({e}), using chunked fetching..."
+                    )
+                    edges = self._fetch_roads_chunked(polygon, road_types,
+                                                      boundary_wgs84,
+                                                      output_path)
 
             print(f"Total road segments: {len(edges):,}")
 
-            # Save to file
-            print("Saving to file...")
-            edges.to_file(output_path, driver='GeoJSON')
-            print(f"Saved roads to {output_path}")
+            # Save to file (chunked GeoParquet fetches are already written)
+            if not output_path.exists():
+                print("Saving to file...")
+                write_vector(edges, output_path)
+                print(f"Saved roads to {output_path}")
 
             return edges
 
@@ -326,14 +878,16 @@ class DataFetcher:
             print(f"Error fetching roads: {e}")
             raise
 
-    def fetch_settlements(
-            self,
-            boundary: Optional[gpd.GeoDataFrame] = None) -> gpd.GeoDataFrame:
+    def fetch_settlements(self,
+                          boundary: Optional[gpd.GeoDataFrame] = None,
+                          bbox: Optional[tuple] = None) -> gpd.GeoDataFrame:
         """
         Fetch settlement points from OpenStreetMap.
         
         Args:
             boundary: GeoDataFrame with boundary polygon. If None, fetches it first.
+            bbox: Optional (minx, miny, maxx, maxy) in EPSG:4326 to load only
+                part of already-fetched settlements
             
         Returns:
             GeoDataFrame with settlement points
@@ -342,33 +896,34 @@ class DataFetcher:
             boundary = self.fetch_state_boundary()
 
         state_name = self.config.state_name
-        output_path = self.config.get_path(
-            'raw_data') / f"{state_name.lower()}_settlements.geojson"
+        output_path = vector_path(self.config.get_path('raw_data'),
+                                  f"{state_name.lower()}_settlements")
 
         # Check if already exists
         if output_path.exists():
             print(f"Settlements already exist at {output_path}")
-            return gpd.read_file(output_path)
+            return read_vector(output_path, bbox=bbox)
 
         print(f"Fetching settlements for {state_name} from OpenStreetMap...")
 
         try:
             # Get the geometry in WGS84 for OSMnx
-            boundary_wgs84 = boundary.to_crs('EPSG:4326')
+            boundary_wgs84 = self._boundary_in_crs(boundary, 'EPSG:4326')
             polygon = boundary_wgs84.geometry.iloc[0]
 
             # Fetch places (settlements)
             tags = {'place': ['city', 'town', 'village', 'hamlet']}
-            settlements = ox.features_from_polygon(polygon, tags=tags)
+            self._configure_osmnx()
+            with self._overpass_slots:
+                settlements = ox.features_from_polygon(polygon, tags=tags)
 
             # Keep only point geometries
-            settlements = settlements[settlements.geometry.type ==
-                                      'Point'].copy()
+            settlements = settlements[settlements.geom_type.values == 'Point']
 
             print(f"Downloaded {len(settlements)} settlements")
 
             # Save to file
-            settlements.to_file(output_path, driver='GeoJSON')
+            write_vector(settlements, output_path)
             print(f"Saved settlements to {output_path}")
 
             return settlements
@@ -378,6 +933,139 @@ class DataFetcher:
             print("Continuing without settlements...")
             return gpd.GeoDataFrame()
 
+    def _download_tile(self, download_url: str, tile_path: Path) -> Path:
+        """
+        Stream one DEM tile to disk and return its path.
+        
+        A tile left complete by an interrupted earlier run is kept if a HEAD
+        request reports the same Content-Length. Tiles are written to a
+        .part file first, so partial downloads are never mistaken for
+        complete ones.
+        """
+        if tile_path.exists():
+            head = self._session.head(download_url,
+                                      allow_redirects=True,
+                                      timeout=30)
+            if (head.ok and int(head.headers.get('content-length', -1))
+                    == tile_path.stat().st_size):
+                return tile_path
+
+        tile_response = self._session.get(download_url, stream=True)
+        tile_response.raise_for_status()
+
+        part_path = tile_path.with_name(tile_path.name + '.part')
+        tile_response.raw.decode_content = True
+        try:
+            with tile_response, open(part_path, 'wb') as f:
+                shutil.copyfileobj(tile_response.raw, f, length=1 << 20)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        part_path.replace(tile_path)
+
+        return tile_path
+
+    def _merge_and_clip_dem(self, all_tiles, boundary, output_path: Path):
+        """
+        Merge DEM tiles block by block into a clipped GeoTIFF (no-VRT fallback).
+        
+        The output is created at the size of the boundary window and filled
+        one 512x512 block at a time: each block reads only the intersecting
+        window of each tile, stops at the first tiles that fill it, and gets
+        nodata outside the boundary. Memory stays at a few blocks instead of
+        the full mosaic.
+        
+        Args:
+            all_tiles: Downloaded tile paths (earlier tiles win on overlap)
+            boundary: State boundary GeoDataFrame
+            output_path: Destination GeoTIFF
+        """
+        print(f"Merging {len(all_tiles)} tiles block by block...")
+        sources = [rasterio.open(str(p)) for p in all_tiles]
+
+        try:
+            first = sources[0]
+            res_x, res_y = first.res
+            nodata = first.nodata if first.nodata is not None else -9999.0
+
+            # Elevations need no more than float32
+            dtype = first.dtypes[0]
+            if dtype == 'float64':
+                dtype = 'float32'
+
+            boundary_proj = self._boundary_in_crs(boundary, first.crs)
+            b_minx, b_miny, b_maxx, b_maxy = boundary_proj.total_bounds
+
+            # Tile extent cropped to the boundary, snapped to the first
+            # tile's pixel grid
+            minx = max(min(src.bounds.left for src in sources), b_minx)
+            maxx = min(max(src.bounds.right for src in sources), b_maxx)
+            miny = max(min(src.bounds.bottom for src in sources), b_miny)
+            maxy = min(max(src.bounds.top for src in sources), b_maxy)
+            if minx >= maxx or miny >= maxy:
+                raise ValueError("DEM tiles do not overlap the state boundary")
+
+            left = first.bounds.left + math.floor(
+                (minx - first.bounds.left) / res_x) * res_x
+            top = first.bounds.top - math.floor(
+                (first.bounds.top - maxy) / res_y) * res_y
+            width = math.ceil((maxx - left) / res_x)
+            height = math.ceil((top - miny) / res_y)
+            out_trans = Affine(res_x, 0, left, 0, -res_y, top)
+
+            profile = {
+                'driver': 'GTiff',
+                'count': first.count,
+                'dtype': dtype,
+                'crs': first.crs,
+                'transform': out_trans,
+                'width': width,
+                'height': height,
+                'nodata': nodata,
+                **raster_write_options(dtype)
+            }
+
+            print("Clipping DEM to state boundary...")
+            with rasterio.Env(GDAL_NUM_THREADS='ALL_CPUS'):
+                with rasterio.open(output_path, 'w', **profile) as dst:
+                    for _, window in dst.block_windows(1):
+                        shape = (window.height, window.width)
+                        block = np.full((first.count, ) + shape,
+                                        nodata,
+                                        dtype=dtype)
+
+                        outside = geometry_mask(
+                            boundary_proj.geometry,
+                            out_shape=shape,
+                            transform=dst.window_transform(window),
+                            all_touched=True)
+                        empty = ~outside
+                        block_box = window_bounds(window, out_trans)
+
+                        for src in sources:
+                            if not empty.any():
+                                break
+                            if (src.bounds.right <= block_box[0]
+                                    or src.bounds.left >= block_box[2]
+                                    or src.bounds.top <= block_box[1]
+                                    or src.bounds.bottom >= block_box[3]):
+                                continue
+
+                            src_window = from_bounds(*block_box,
+                                                     transform=src.transform)
+                            data = src.read(window=src_window,
+                                            out_shape=block.shape,
+                                            boundless=True,
+                                            masked=True)
+                            fill = empty & ~np.ma.getmaskarray(data)[0]
+                            block[:, fill] = data.data[:, fill]
+                            empty &= ~fill
+
+                        dst.write(block, window=window)
+        finally:
+            for src in sources:
+                src.close()
+
     def fetch_dem(self, boundary: Optional[gpd.GeoDataFrame] = None) -> str:
         """
         Fetch Digital Elevation Model from USGS 3DEP.
@@ -409,7 +1097,7 @@ class DataFetcher:
 
         try:
             # Get boundary in WGS84
-            boundary_wgs84 = boundary.to_crs('EPSG:4326')
+            boundary_wgs84 = self._boundary_in_crs(boundary, 'EPSG:4326')
             bounds = boundary_wgs84.total_bounds  # minx, miny, maxx, maxy
 
             # Use The National Map API
@@ -424,7 +1112,7 @@ class DataFetcher:
             }
 
             print(f"Querying National Map API for DEM tiles...")
-            response = requests.get(base_url, params=params, timeout=30)
+            response = self._session.get(base_url, params=params, timeout=30)
             response.raise_for_status()
 
             # Check if response is actually JSON
@@ -446,7 +1134,9 @@ class DataFetcher:
                 # Try 1 arc-second data as fallback
                 params[
                     'datasets'] = 'National Elevation Dataset (NED) 1 arc-second'
-                response = requests.get(base_url, params=params, timeout=30)
+                response = self._session.get(base_url,
+                                             params=params,
+                                             timeout=30)
                 response.raise_for_status()
 
                 try:
@@ -466,103 +1156,94 @@ class DataFetcher:
             temp_dir = self.config.get_path('raw_data') / 'temp_dem'
             temp_dir.mkdir(exist_ok=True)
 
-            # Process in batches to avoid filling disk
-            batch_size = 20  # Process 20 tiles at a time
-            all_tiles = []
+            tile_jobs = []
+            for i, item in enumerate(items):
+                download_url = item.get('downloadURL')
+                if not download_url:
+                    continue
+                tile_jobs.append(
+                    (download_url, temp_dir / f"tile_{i + 1}.tif"))
 
             try:
-                for batch_start in range(0, len(items), batch_size):
-                    batch_end = min(batch_start + batch_size, len(items))
-                    batch_items = items[batch_start:batch_end]
-
-                    print(
-                        f"\nProcessing batch {batch_start//batch_size + 1} (tiles {batch_start+1}-{batch_end})..."
-                    )
-                    tile_paths = []
-
-                    # Download batch
-                    for i, item in enumerate(batch_items):
-                        download_url = item.get('downloadURL')
-                        if not download_url:
-                            continue
-
-                        tile_num = batch_start + i + 1
-                        print(f"  Downloading tile {tile_num}/{len(items)}...")
-
-                        # Download file
-                        tile_response = requests.get(download_url, stream=True)
-                        tile_response.raise_for_status()
-
-                        # Save to temp file
-                        tile_path = temp_dir / f"tile_{tile_num}.tif"
-
-                        with open(tile_path, 'wb') as f:
-                            for chunk in tile_response.iter_content(
-                                    chunk_size=8192):
-                                f.write(chunk)
-
-                        tile_paths.append(tile_path)
-
-                    all_tiles.extend(tile_paths)
-                    print(
-                        f"  Batch {batch_start//batch_size + 1} downloaded ({len(tile_paths)} tiles)"
-                    )
-
-                # Merge all tiles
-                print(f"\nMerging {len(all_tiles)} tiles...")
-                src_files = [rasterio.open(str(p)) for p in all_tiles]
-
-                mosaic, out_trans = merge(src_files)
-
-                # Close source files
-                for src in src_files:
-                    src.close()
-
-                # Get profile from first tile
-                with rasterio.open(all_tiles[0]) as src:
-                    out_meta = src.profile.copy()
-
-                # Update profile for merged raster
-                out_meta.update({
-                    "driver": "GTiff",
-                    "height": mosaic.shape[1],
-                    "width": mosaic.shape[2],
-                    "transform": out_trans,
-                    "compress": "lzw"
-                })
-
-                # Clip to boundary and save
-                print("Clipping DEM to state boundary...")
-                boundary_proj = boundary.to_crs(out_meta['crs'])
-
-                with rasterio.MemoryFile() as memfile:
-                    with memfile.open(**out_meta) as mem_dataset:
-                        mem_dataset.write(mosaic)
-
-                    with memfile.open() as mem_dataset:
-                        clipped, clip_trans = mask(mem_dataset,
+                # Download all tiles (I/O-bound, so they download
+                # concurrently; the pool bounds the number in flight)
+                max_workers = self.config.get('data.download_workers', 8)
+                print(
+                    f"Downloading {len(tile_jobs)} tiles ({max_workers} workers)..."
+                )
+                all_tiles = []
+
+                if max_workers <= 1:
+                    for download_url, tile_path in tqdm(tile_jobs):
+                        all_tiles.append(
+                            self._download_tile(download_url, tile_path))
+                else:
+                    with ThreadPoolExecutor(
+                            max_workers=max_workers) as executor:
+                        futures = [
+                            executor.submit(self._download_tile,
+                                            download_url, tile_path)
+                            for download_url, tile_path in tile_jobs
+                        ]
+                        for future in tqdm(as_completed(futures),
+                                           total=len(futures)):
+                            all_tiles.append(future.result())
+
+                # Keep tile order stable for merging
+                all_tiles.sort(key=lambda p: int(p.stem.split('_')[1]))
+
+                # Mosaic the tiles through a VRT and clip in one pass: GDAL
+                # reads only the blocks touching the boundary, with a
+                # constant number of open files
+                vrt_path = temp_dir / 'mosaic.vrt'
+                print(f"\nBuilding VRT mosaic of {len(all_tiles)} tiles...")
+
+                if build_vrt(all_tiles, vrt_path):
+                    print("Clipping DEM to state boundary...")
+                    with rasterio.open(vrt_path) as src:
+                        boundary_proj = self._boundary_in_crs(
+                            boundary, src.crs)
+                        clipped, clip_trans = mask(src,
                                                    boundary_proj.geometry,
                                                    crop=True,
                                                    all_touched=True)
 
-                        clip_meta = mem_dataset.profile.copy()
+                        # Elevations need no more than float32
+                        if clipped.dtype == np.float64:
+                            clipped = clipped.astype(np.float32)
+
+                        clip_meta = src.profile.copy()
                         clip_meta.update({
+                            "driver": "GTiff",
+                            "dtype": clipped.dtype.name,
                             "height": clipped.shape[1],
                             "width": clipped.shape[2],
-                            "transform": clip_trans
+                            "transform": clip_trans,
+                            **raster_write_options(clipped.dtype)
                         })
 
-                # Save clipped raster
-                with rasterio.open(output_path, 'w', **clip_meta) as dst:
-                    dst.write(clipped)
+                    # Save clipped raster (compression on all cores)
+                    with rasterio.Env(GDAL_NUM_THREADS='ALL_CPUS'):
+                        with rasterio.open(output_path, 'w',
+                                           **clip_meta) as dst:
+                            dst.write(clipped)
+                else:
+                    self._merge_and_clip_dem(all_tiles, boundary, output_path)
+
+                if self.config.get('data.raster_overviews', False):
+                    add_overviews(output_path)
 
                 print(f"Saved DEM to {output_path}")
 
-            finally:
-                # Clean up temp directory
-                if temp_dir.exists():
-                    shutil.rmtree(temp_dir)
-                    print("Cleaned up temporary files")
+            except Exception:
+                # Keep finished tiles so the next run only fetches the rest
+                print(f"Keeping downloaded tiles in {temp_dir} for resume")
+                raise
+
+            # Clean up temp directory
+            if temp_dir.exists():
+                shutil.rmtree(temp_dir)
+                print("Cleaned up temporary files")
 
             return str(output_path)
 
@@ -616,19 +1297,31 @@ class DataFetcher:
                 "https://mrlc.s3.us-west-2.amazonaws.com/nlcd_2021_land_cover_l48_20230630.zip",
             ]
 
+            # Probe all mirrors at once and take the first that answers;
+            # slower probes are not waited for
             url = None
-            for test_url in possible_urls:
-                try:
-                    print(f"Trying URL: {test_url}")
-                    test_response = requests.head(test_url, timeout=10)
-                    if test_response.status_code == 200:
+            executor = ThreadPoolExecutor(max_workers=len(possible_urls))
+            futures = {
+                executor.submit(self._session.head, test_url, timeout=10):
+                test_url
+                for test_url in possible_urls
+            }
+            try:
+                for future in as_completed(futures):
+                    test_url = futures[future]
+                    try:
+                        status = future.result().status_code
+                    except Exception as e:
+                        print(f"  ✗ {test_url} failed: {e}")
+                        continue
+
+                    if status == 200:
                         url = test_url
-                        print("  ✓ URL accessible")
+                        print(f"  ✓ URL accessible: {test_url}")
                         break
-                    else:
-                        print(f"  ✗ Got status {test_response.status_code}")
-                except Exception as e:
-                    print(f"  ✗ Failed: {e}")
+                    print(f"  ✗ {test_url} got status {status}")
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
 
             if not url:
                 print("\nAutomatic download not available.")
@@ -645,74 +1338,70 @@ class DataFetcher:
                 print(f"\nOr place the full CONUS file at: {output_path}")
                 raise ValueError("No working download URL found for NLCD data")
 
-            # Use project's data directory for temp files
-            temp_dir = self.config.get_path('raw_data') / 'temp_landcover'
-            temp_dir.mkdir(exist_ok=True)
-            zip_path = temp_dir / "nlcd_2021.zip"
-
-            try:
-                print("Downloading NLCD 2021 data...")
-                print("(This is a large file and may take 10-30 minutes)")
-
-                response = requests.get(url, stream=True)
-                response.raise_for_status()
-
-                total_size = int(response.headers.get('content-length', 0))
-
-                with open(zip_path, 'wb') as f:
-                    with tqdm(total=total_size, unit='B',
-                              unit_scale=True) as pbar:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            f.write(chunk)
-                            pbar.update(len(chunk))
-
-                print("Extracting archive...")
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                # Find the .tif file in extracted files
-                tif_files = list(Path(temp_dir).glob("**/*.tif"))
-
-                if not tif_files:
-                    raise FileNotFoundError(
-                        "No .tif file found in NLCD archive")
-
-                nlcd_path = tif_files[0]
-                print(f"Found land cover file: {nlcd_path.name}")
-
-                # Clip to boundary
-                print("Clipping land cover to state boundary...")
-
-                with rasterio.open(nlcd_path) as src:
-                    # Reproject boundary to match raster CRS
-                    boundary_proj = boundary.to_crs(src.crs)
-
-                    # Clip
-                    clipped, clip_trans = mask(src,
-                                               boundary_proj.geometry,
-                                               crop=True,
-                                               all_touched=True)
-
-                    # Update metadata
-                    clip_meta = src.profile.copy()
-                    clip_meta.update({
-                        "height": clipped.shape[1],
-                        "width": clipped.shape[2],
-                        "transform": clip_trans,
-                        "compress": "lzw"
-                    })
+            # Keep the archive in the shared download cache: other states
+            # are clipped from the same CONUS file, and an unchanged file is
+            # revalidated with a single conditional request
+            print("Downloading NLCD 2021 data...")
+            print("(This is a large file and may take 10-30 minutes)")
+            zip_path = self._download_cached(
+                url,
+                self.config.get_path('raw_data') / '.cache' /
+                url.rsplit('/', 1)[-1])
+            print(f"NLCD archive cached at {zip_path} (safe to delete)")
+
+            # Find the .tif member; it is read in place through GDAL's
+            # /vsizip/ instead of extracting a second multi-GB copy
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                tif_members = [
+                    name for name in zip_ref.namelist()
+                    if name.lower().endswith('.tif')
+                ]
+
+            if not tif_members:
+                raise FileNotFoundError("No .tif file found in NLCD archive")
+
+            nlcd_member = tif_members[0]
+            print(f"Found land cover file: {Path(nlcd_member).name}")
+
+            # Clip to boundary
+            print("Clipping land cover to state boundary...")
+
+            with rasterio.open(f"/vsizip/{zip_path}/{nlcd_member}") as src:
+                # Reproject boundary to match raster CRS
+                boundary_proj = self._boundary_in_crs(boundary, src.crs)
+
+                # Clip (NLCD uses 250 for no data; 255 if unset)
+                nodata = src.nodata if src.nodata is not None else 255
+                clipped, clip_trans = mask(src,
+                                           boundary_proj.geometry,
+                                           crop=True,
+                                           all_touched=True,
+                                           nodata=nodata)
+
+                # NLCD class codes (0-255) always fit in uint8
+                if clipped.dtype != np.uint8:
+                    clipped = clipped.astype(np.uint8)
+
+                # Update metadata
+                clip_meta = src.profile.copy()
+                clip_meta.update({
+                    "height": clipped.shape[1],
+                    "width": clipped.shape[2],
+                    "transform": clip_trans,
+                    "dtype": 'uint8',
+                    "nodata": nodata,
+                    **raster_write_options(clipped.dtype, categorical=True)
+                })
 
-                    # Save
+                # Save (compression on all cores)
+                with rasterio.Env(GDAL_NUM_THREADS='ALL_CPUS'):
                     with rasterio.open(output_path, 'w', **clip_meta) as dst:
                         dst.write(clipped)
 
-                print(f"Saved land cover to {output_path}")
+            if self.config.get('data.raster_overviews', False):
+                add_overviews(output_path, categorical=True)
 
-            finally:
-                # Clean up temp directory
-                if temp_dir.exists():
-                    shutil.rmtree(temp_dir)
-                    print("Cleaned up temporary files")
+            print(f"Saved land cover to {output_path}")
 
             return str(output_path)
 
@@ -743,16 +1432,21 @@ class DataFetcher:
         # Fetch boundary
         boundary = self.fetch_state_boundary()
 
-        # Fetch roads
-        roads = self.fetch_roads(boundary)
-
-        # Optionally fetch settlements
-        data = {'boundary': boundary, 'roads': roads}
-
-        if self.config.get('data.include_settlements', False):
-            settlements = self.fetch_settlements(boundary)
-            if len(settlements) > 0:
-                data['settlements'] = settlements
+        # Fetch roads and (optionally) settlements concurrently: both only
+        # need the boundary and spend their time waiting on Overpass
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            roads_future = executor.submit(self.fetch_roads, boundary)
+            settlements_future = None
+            if self.config.get('data.include_settlements', False):
+                settlements_future = executor.submit(self.fetch_settlements,
+                                                     boundary)
+
+            data = {'boundary': boundary, 'roads': roads_future.result()}
+
+            if settlements_future is not None:
+                settlements = settlements_future.result()
+                if len(settlements) > 0:
+                    data['settlements'] = settlements
 
         # Note: DEM and land cover are now automatically extracted during
         # cost-surface generation via ensure_terrain_data()
@@ -6,16 +6,31 @@ This module handles:
 - Clipping roads to state boundary
 - Rasterization of vector data
 """
+import math
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple
 
 import geopandas as gpd
 import numpy as np
+import pandas as pd
 import rasterio
+import shapely
 from rasterio.features import rasterize
-from rasterio.transform import from_bounds
+from rasterio.transform import Affine, from_bounds
+from rasterio.windows import Window
 
 from .config import get_config
+from .vector_io import HAS_PYARROW, VECTOR_EXTENSIONS, write_vector
+
+# File extension for each output.vector_format value
+VECTOR_FORMAT_EXTENSIONS = {
+    'parquet': '.parquet',
+    'flatgeobuf': '.fgb',
+    'geojson': '.geojson'
+}
 
 
 class DataPreprocessor:
@@ -50,7 +65,9 @@ class DataPreprocessor:
             print("Warning: Input data has no CRS, assuming EPSG:4326")
             gdf = gdf.set_crs('EPSG:4326')
 
-        if gdf.crs.to_string() == target_crs:
+        # pyproj compares CRS definitions, so equivalent spellings of the
+        # target (e.g. "epsg:5070" vs "EPSG:5070") skip the reprojection
+        if gdf.crs == target_crs:
             return gdf
 
         print(f"Reprojecting from {gdf.crs} to {target_crs}")
@@ -74,8 +91,15 @@ class DataPreprocessor:
         if roads.crs != boundary.crs:
             boundary = boundary.to_crs(roads.crs)
 
-        # Clip
-        clipped = gpd.clip(roads, boundary)
+        # Roads strictly inside the boundary are kept as they are; only the
+        # (few) roads crossing it go through the GEOS intersection in clip
+        polygon = shapely.union_all(np.asarray(boundary.geometry.array))
+        shapely.prepare(polygon)
+        inside = shapely.contains_properly(polygon,
+                                           np.asarray(roads.geometry.array))
+
+        clipped = pd.concat(
+            [roads[inside], gpd.clip(roads[~inside], boundary)])
 
         print(
             f"Clipped {len(roads)} roads to {len(clipped)} road segments within boundary"
@@ -83,19 +107,18 @@ class DataPreprocessor:
 
         return clipped
 
-    def create_raster_grid(
-            self,
-            boundary: gpd.GeoDataFrame,
-            resolution: Optional[int] = None) -> Tuple[np.ndarray, dict]:
+    def create_raster_metadata(self,
+                               boundary: gpd.GeoDataFrame,
+                               resolution: Optional[int] = None) -> dict:
         """
-        Create an empty raster grid based on boundary extent.
+        Compute the raster grid (transform and size) covering the boundary.
         
         Args:
             boundary: GeoDataFrame with boundary polygon
             resolution: Pixel resolution in meters. If None, uses config value.
             
         Returns:
-            Tuple of (array, metadata dict with transform, width, height, crs)
+            Metadata dict with transform, width, height, crs and bounds
         """
         resolution = resolution or self.config.resolution
 
@@ -103,15 +126,12 @@ class DataPreprocessor:
         minx, miny, maxx, maxy = boundary.total_bounds
 
         # Calculate grid dimensions
-        width = int(np.ceil((maxx - minx) / resolution))
-        height = int(np.ceil((maxy - miny) / resolution))
+        width = math.ceil((maxx - minx) / resolution)
+        height = math.ceil((maxy - miny) / resolution)
 
         # Create transform
         transform = from_bounds(minx, miny, maxx, maxy, width, height)
 
-        # Create empty array
-        array = np.zeros((height, width), dtype=np.uint8)
-
         metadata = {
             'transform': transform,
             'width': width,
@@ -124,6 +144,27 @@ class DataPreprocessor:
             f"Created raster grid: {width}x{height} pixels at {resolution}m resolution"
         )
 
+        return metadata
+
+    def create_raster_grid(
+            self,
+            boundary: gpd.GeoDataFrame,
+            resolution: Optional[int] = None) -> Tuple[np.ndarray, dict]:
+        """
+        Create an empty raster grid based on boundary extent.
+        
+        Prefer create_raster_metadata when the array is not needed.
+        
+        Args:
+            boundary: GeoDataFrame with boundary polygon
+            resolution: Pixel resolution in meters. If None, uses config value.
+            
+        Returns:
+            Tuple of (array, metadata dict with transform, width, height, crs)
+        """
+        metadata = self.create_raster_metadata(boundary, resolution)
+        array = np.zeros((metadata['height'], metadata['width']),
+                         dtype=np.uint8)
         return array, metadata
 
     def rasterize_roads(self, roads: gpd.GeoDataFrame,
@@ -132,7 +173,10 @@ class DataPreprocessor:
         """
         Rasterize road vectors to a binary mask.
         
-        Uses chunked processing to handle large road networks without exhausting memory.
+        Small networks are burned in a single rasterize call. Large networks
+        are burned band by band (horizontal strips of rows), each band
+        receiving only the roads that overlap it, so memory stays bounded
+        without re-touching the whole raster per chunk.
         
         Args:
             roads: GeoDataFrame with roads
@@ -144,48 +188,72 @@ class DataPreprocessor:
         """
         print(f"Rasterizing {len(roads)} road segments...")
 
-        # Create output array
-        road_mask = np.zeros(raster_shape, dtype=np.uint8)
-
-        # Process in chunks to avoid memory issues with large datasets
-        # Use smaller chunks for very large datasets
-        if len(roads) > 500_000:
-            chunk_size = 10000  # Small chunks for huge datasets
-        elif len(roads) > 100_000:
-            chunk_size = 25000  # Medium chunks
+        # Create output array; every rasterize call burns into it directly.
+        # Grids too large for RAM are backed by an (anonymous) temp file
+        # that the kernel pages in and out as bands are burned.
+        memmap_mb = self.config.get('raster.memmap_threshold_mb', 4096)
+        if raster_shape[0] * raster_shape[1] > memmap_mb * 1024**2:
+            print("  Large grid: backing the road mask with a temp file")
+            scratch = tempfile.TemporaryFile(
+                dir=self.config.get_path('processed_data'))
+            road_mask = np.memmap(scratch,
+                                  dtype=np.uint8,
+                                  mode='w+',
+                                  shape=raster_shape)
         else:
-            chunk_size = 50000  # Default
-
-        n_chunks = int(np.ceil(len(roads) / chunk_size))
-
-        if n_chunks > 1:
-            print(
-                f"  Processing in {n_chunks} chunks ({chunk_size:,} roads per chunk)"
-            )
-
-        for i in range(n_chunks):
-            start_idx = i * chunk_size
-            end_idx = min((i + 1) * chunk_size, len(roads))
-            chunk = roads.iloc[start_idx:end_idx]
-
-            if n_chunks > 1:
-                print(f"  Chunk {i+1}/{n_chunks}: {len(chunk):,} roads")
-
-            # Create shapes for this chunk
-            shapes = [(geom, 1) for geom in chunk.geometry if geom is not None]
-
-            # Rasterize chunk and combine with existing mask
-            chunk_mask = rasterize(
-                shapes=shapes,
-                out_shape=raster_shape,
-                transform=transform,
-                fill=0,
-                dtype=np.uint8,
-                all_touched=True  # Include pixels touched by roads
-            )
-
-            # Combine with existing mask (OR operation)
-            road_mask = np.maximum(road_mask, chunk_mask)
+            road_mask = np.zeros(raster_shape, dtype=np.uint8)
+
+        # Rasterize in horizontal bands of rows for large networks, so GDAL
+        # only holds the geometries touching one band at a time (about
+        # chunk_size roads per band)
+        chunk_size = self.config.get('raster.rasterize_chunk_size', 5000)
+
+        # Drop missing/empty geometries once, and order the rest by their
+        # southern edge so each band's candidates are a contiguous prefix
+        geoms = np.asarray(roads.geometry.array)
+        geoms = geoms[~(shapely.is_missing(geoms) | shapely.is_empty(geoms))]
+        bounds = shapely.bounds(geoms)  # minx, miny, maxx, maxy
+        order = np.argsort(bounds[:, 1], kind='stable')
+        geoms, bounds = geoms[order], bounds[order]
+
+        n_bands = min(int(np.ceil(len(geoms) / chunk_size)), raster_shape[0])
+
+        if n_bands == 1:
+            rasterize(((geom, 1) for geom in geoms),
+                      out=road_mask,
+                      transform=transform,
+                      all_touched=True)  # Include pixels touched by roads
+        elif n_bands > 1:
+            band_height = int(np.ceil(raster_shape[0] / n_bands))
+            n_bands = int(np.ceil(raster_shape[0] / band_height))
+            max_workers = os.cpu_count() or 1
+            print(f"  Processing in {n_bands} bands of {band_height:,} rows "
+                  f"({max_workers} threads)")
+
+            def rasterize_band(i):
+                row_start = i * band_height
+                row_end = min(row_start + band_height, raster_shape[0])
+
+                # Geometries overlapping the band (north-up raster), padded
+                # by a pixel for all_touched
+                top = transform.f + row_start * transform.e
+                bottom = transform.f + row_end * transform.e
+                pad = abs(transform.e)
+                end = np.searchsorted(bounds[:, 1], top + pad, side='right')
+                in_band = np.flatnonzero(bounds[:end, 3] >= bottom - pad)
+                if in_band.size == 0:
+                    return
+
+                rasterize(((geom, 1) for geom in geoms[in_band]),
+                          out=road_mask[row_start:row_end],
+                          transform=transform *
+                          Affine.translation(0, row_start),
+                          all_touched=True)
+
+            # Bands write to disjoint slices of the mask, and GDAL burns
+            # without holding the GIL, so bands run in parallel
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(rasterize_band, range(n_bands)))
 
         road_pixels = np.sum(road_mask)
         total_pixels = road_mask.size
@@ -208,12 +276,12 @@ class DataPreprocessor:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Determine number of bands and data type
-        if array.ndim == 2:
-            count = 1
-            array = array[np.newaxis, :, :]  # Add band dimension
-        else:
-            count = array.shape[0]
+        # Determine number of bands (2D arrays are written as band 1)
+        count = 1 if array.ndim == 2 else array.shape[0]
+
+        # Horizontal differencing for integers, floating-point predictor
+        # for floats
+        predictor = 3 if np.issubdtype(array.dtype, np.floating) else 2
 
         with rasterio.open(output_path,
                            'w',
@@ -224,8 +292,25 @@ class DataPreprocessor:
                            dtype=array.dtype,
                            crs=metadata['crs'],
                            transform=metadata['transform'],
-                           compress='lzw') as dst:
-            dst.write(array)
+                           compress='deflate',
+                           predictor=predictor,
+                           zlevel=6,
+                           tiled=True,
+                           blockxsize=512,
+                           blockysize=512,
+                           BIGTIFF='IF_SAFER',
+                           num_threads='all_cpus') as dst:
+            # Write one row of tiles at a time so a memory-mapped array is
+            # streamed through and GDAL compresses whole tile rows in turn
+            block_height = dst.block_shapes[0][0]
+            for row in range(0, metadata['height'], block_height):
+                window = Window(0, row, metadata['width'],
+                                min(block_height, metadata['height'] - row))
+                rows = slice(row, row + window.height)
+                if array.ndim == 2:
+                    dst.write(array[rows], 1, window=window)
+                else:
+                    dst.write(array[:, rows], window=window)
 
         print(f"Saved raster to {output_path}")
 
@@ -257,7 +342,7 @@ class DataPreprocessor:
 
         # Create raster grid
         print("\n4. Creating raster grid...")
-        road_mask, metadata = self.create_raster_grid(boundary)
+        metadata = self.create_raster_metadata(boundary)
 
         # Rasterize roads
         print("\n5. Rasterizing roads...")
@@ -275,8 +360,21 @@ class DataPreprocessor:
             state_folder = processed_dir / state_name
             state_folder.mkdir(parents=True, exist_ok=True)
 
-            boundary.to_file(state_folder / "boundary_projected.geojson")
-            roads_clipped.to_file(state_folder / "roads_clipped.geojson")
+            vector_format = self.config.get('output.vector_format',
+                                            'parquet')
+            ext = VECTOR_FORMAT_EXTENSIONS.get(vector_format, '.geojson')
+            if ext == '.parquet' and not HAS_PYARROW:
+                ext = '.fgb'
+
+            for stem, gdf in (('boundary_projected', boundary),
+                              ('roads_clipped', roads_clipped)):
+                # Remove copies in other formats so readers cannot pick up
+                # a stale one
+                for old_ext in VECTOR_EXTENSIONS:
+                    old_path = state_folder / f"{stem}{old_ext}"
+                    if old_ext != ext and old_path.exists():
+                        old_path.unlink()
+                write_vector(gdf, state_folder / f"{stem}{ext}")
 
             # Save road mask raster
             self.save_raster(road_mask, metadata,
@@ -0,0 +1,135 @@
+"""
+Vector file helpers for fetched data.
+
+Fetched layers are written as FlatGeobuf (binary, with a spatial index),
+which loads several times faster than GeoJSON. Large columnar layers (roads)
+are written as GeoParquet when pyarrow is installed. Readers still accept
+GeoJSON files written by older versions.
+"""
+import inspect
+from pathlib import Path
+
+from shapely.geometry import box
+
+try:
+    import pyogrio  # noqa: F401
+    HAS_PYOGRIO = True
+except ImportError:
+    HAS_PYOGRIO = False
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Lookup order for existing files
+VECTOR_EXTENSIONS = ('.parquet', '.fgb', '.geojson')
+
+DRIVERS = {'.fgb': 'FlatGeobuf', '.geojson': 'GeoJSON'}
+
+
+def _parquet_supports_bbox() -> bool:
+    """Whether geopandas can write and filter GeoParquet bbox coverings."""
+    import geopandas as gpd
+
+    return 'bbox' in inspect.signature(gpd.read_parquet).parameters
+
+
+def vector_path(folder: Path, stem: str, columnar: bool = False) -> Path:
+    """
+    Resolve the path of a vector layer, accepting any supported extension.
+
+    Args:
+        folder: Directory containing the layer
+        stem: File name without extension (e.g., "boundary")
+        columnar: Prefer GeoParquet for new files (if pyarrow is installed)
+
+    Returns:
+        Path of the existing file, or the preferred path if none exists
+    """
+    for ext in VECTOR_EXTENSIONS:
+        path = Path(folder) / f"{stem}{ext}"
+        if path.exists():
+            return path
+
+    ext = '.parquet' if columnar and HAS_PYARROW else '.fgb'
+    return Path(folder) / f"{stem}{ext}"
+
+
+def read_vector(path: Path, columns=None, bbox=None):
+    """
+    Read a vector layer written by write_vector.
+
+    Args:
+        path: Source (.parquet, .fgb or .geojson)
+        columns: Optional list of attribute columns to load (GeoParquet only
+            skips the others on disk)
+        bbox: Optional (minx, miny, maxx, maxy) in the layer's CRS; only
+            features intersecting it are returned. For FlatGeobuf/GeoJSON
+            the filter is applied by OGR (using the .fgb spatial index).
+            For GeoParquet it is pushed down to the row groups when the file
+            has a bbox covering column and geopandas >= 1.0 is installed;
+            otherwise the whole file is read and filtered afterwards.
+
+    Returns:
+        GeoDataFrame
+    """
+    import geopandas as gpd
+
+    path = Path(path)
+
+    if path.suffix == '.parquet':
+        if columns is not None:
+            columns = list(columns) + ['geometry']
+        gdf = None
+        if bbox is not None and _parquet_supports_bbox():
+            try:
+                gdf = gpd.read_parquet(path, columns=columns,
+                                       bbox=tuple(bbox))
+            except ValueError:
+                # No bbox covering column (e.g. written by geopandas < 1.0)
+                gdf = None
+        if gdf is None:
+            gdf = gpd.read_parquet(path, columns=columns)
+        if bbox is not None:
+            # The covering filter matches on bounding boxes only
+            gdf = gdf[gdf.intersects(box(*bbox))]
+        if columns is None and 'bbox' in gdf.columns:
+            gdf = gdf.drop(columns='bbox')
+        return gdf
+
+    kwargs = {'engine': 'pyogrio'} if HAS_PYOGRIO else {}
+    if bbox is not None:
+        kwargs['bbox'] = tuple(bbox)
+    gdf = gpd.read_file(path, **kwargs)
+
+    if columns is not None:
+        gdf = gdf[[c for c in columns if c in gdf.columns] + ['geometry']]
+    return gdf
+
+
+def write_vector(gdf, output_path: Path):
+    """
+    Write a GeoDataFrame using the format matching the file extension.
+
+    Args:
+        gdf: GeoDataFrame to write
+        output_path: Destination (.parquet, .fgb or .geojson)
+    """
+    output_path = Path(output_path)
+
+    if output_path.suffix == '.parquet':
+        # A bbox covering column lets read_vector(bbox=...) skip row groups
+        kwargs = ({'write_covering_bbox': True}
+                  if _parquet_supports_bbox() else {})
+        gdf.to_parquet(output_path, compression='zstd', **kwargs)
+        return
+
+    driver = DRIVERS.get(output_path.suffix, 'GeoJSON')
+    kwargs = {'engine': 'pyogrio'} if HAS_PYOGRIO else {}
+
+    if driver == 'FlatGeobuf':
+        gdf.to_file(output_path, driver=driver, SPATIAL_INDEX='YES', **kwargs)
+    else:
+        gdf.to_file(output_path, driver=driver, **kwargs)
@@ -5,20 +5,67 @@ This module creates:
 - Static maps with matplotlib
 - Interactive maps with folium
 """
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional
 
 import branca.colormap as cm
 import folium
 import geopandas as gpd
+import matplotlib
 import matplotlib.patches as mpatches
-import matplotlib.pyplot as plt
 import numpy as np
 from folium import plugins
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.figure import Figure
 
 from .config import get_config
 
+# Above this many top-N points the interactive map draws plain circles from
+# one GeoJSON layer instead of individual numbered markers
+MAX_NUMBERED_MARKERS = 20
+
+
+def downsample_for_display(array: np.ndarray, extent: list, figsize,
+                           dpi) -> tuple:
+    """
+    Block-average a raster down to roughly the pixel size it is drawn at.
+    
+    matplotlib resamples images to the figure's pixel grid anyway; handing
+    it a raster at display size avoids passing (and resampling) the full
+    state-scale array.
+    
+    Args:
+        array: 2D raster (NaN = no data)
+        extent: imshow extent [left, right, bottom, top] of the array
+        figsize: Figure size in inches (width, height)
+        dpi: Output DPI
+        
+    Returns:
+        Tuple of (downsampled array, matching extent)
+    """
+    factor = min(array.shape[0] // int(figsize[1] * dpi),
+                 array.shape[1] // int(figsize[0] * dpi))
+    if factor < 2:
+        return array, extent
+
+    # Trim the ragged right/bottom edge so the array splits into blocks
+    height = array.shape[0] // factor * factor
+    width = array.shape[1] // factor * factor
+    blocks = array[:height, :width].reshape(height // factor, factor,
+                                            width // factor, factor)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN blocks
+        small = np.nanmean(blocks, axis=(1, 3), dtype=np.float32)
+
+    left, right, bottom, top = extent
+    x_size = (right - left) / array.shape[1]
+    y_size = (top - bottom) / array.shape[0]
+    return small, [left, left + width * x_size, top - height * y_size, top]
+
 
 class Visualizer:
     """Creates visualizations of unreachability analysis."""
@@ -33,6 +80,32 @@ class Visualizer:
         self.config = config or get_config()
         self.config.ensure_directories()
 
+        # One Agg figure reused (cleared) by every static map, and
+        # colormaps looked up once by name
+        self._figure = None
+        self._cmaps = {}
+
+    def _get_figure(self, figsize) -> Figure:
+        """
+        Get the shared static-map figure, cleared and resized.
+        
+        The figure is drawn through its own Agg canvas rather than pyplot,
+        so no pyplot figure manager is created or torn down per map.
+        """
+        if self._figure is None:
+            self._figure = Figure(figsize=figsize)
+            FigureCanvasAgg(self._figure)
+        else:
+            self._figure.clf()
+            self._figure.set_size_inches(figsize)
+        return self._figure
+
+    def _get_cmap(self, name: str):
+        """Look up a matplotlib colormap by name, caching the result."""
+        if name not in self._cmaps:
+            self._cmaps[name] = matplotlib.colormaps[name]
+        return self._cmaps[name]
+
     def create_static_map(self,
                           distance_field: np.ndarray,
                           boundary: gpd.GeoDataFrame,
@@ -67,7 +140,8 @@ class Visualizer:
 
         # Create figure
         figsize = self.config.get('visualization.figsize', [12, 10])
-        fig, ax = plt.subplots(figsize=figsize)
+        fig = self._get_figure(figsize)
+        ax = fig.add_subplot()
 
         # Get transform for extent
         transform = metadata['transform']
@@ -75,10 +149,16 @@ class Visualizer:
         extent = [bounds[0], bounds[2], bounds[1], bounds[3]]
 
         # Plot distance field as heatmap
-        cmap = self.config.get('visualization.colormap', 'YlOrRd')
+        cmap = self._get_cmap(
+            self.config.get('visualization.colormap', 'YlOrRd'))
 
-        # Convert distance to km for display
-        distance_km = distance_field / 1000
+        # Convert distance to km for display, at display resolution
+        # (downsample first so the conversion runs on the small array)
+        dpi = self.config.get('visualization.dpi', 300)
+        distance_km, extent = downsample_for_display(distance_field, extent,
+                                                     figsize, dpi)
+        distance_km = (distance_km.astype(np.float32, copy=False) *
+                       np.float32(0.001))
 
         im = ax.imshow(distance_km,
                        extent=extent,
@@ -88,7 +168,7 @@ class Visualizer:
                        alpha=0.8)
 
         # Add colorbar
-        cbar = plt.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
+        cbar = fig.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
         cbar.set_label('Distance from Road (km)',
                        rotation=270,
                        labelpad=20,
@@ -100,15 +180,25 @@ class Visualizer:
                                linewidth=2,
                                label='State Boundary')
 
-        # Plot roads (sample if too many)
+        # Plot roads (sample if too many): draw row positions instead of
+        # shuffling the whole table
         if len(roads) > 10000:
-            roads_sample = roads.sample(n=10000, random_state=42)
+            idx = np.random.default_rng(42).choice(len(roads),
+                                                   size=10000,
+                                                   replace=False)
+            roads_sample = roads.iloc[np.sort(idx)]
             print(
                 f"  Plotting sample of {len(roads_sample)} roads (out of {len(roads)})"
             )
         else:
             roads_sample = roads
 
+        # Detail finer than a raster cell is invisible at map scale, so
+        # simplify before matplotlib draws every vertex
+        if len(roads_sample) > 0:
+            roads_sample = roads_sample.set_geometry(
+                roads_sample.geometry.simplify(self.config.resolution))
+
         roads_sample.plot(ax=ax,
                           color='black',
                           linewidth=0.3,
@@ -212,14 +302,14 @@ class Visualizer:
         ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.5)
 
         # Tight layout
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Save
-        dpi = self.config.get('visualization.dpi', 300)
-        plt.savefig(output_path, dpi=dpi, bbox_inches='tight')
+        fig.savefig(output_path, dpi=dpi, bbox_inches='tight')
         print(f"  Saved static map to {output_path}")
 
-        plt.close()
+        # Drop the map's artists (and its image data) until the next map
+        fig.clf()
 
         return output_path
 
@@ -256,7 +346,8 @@ class Visualizer:
 
         # Create figure
         figsize = self.config.get('visualization.figsize', [12, 10])
-        fig, ax = plt.subplots(figsize=figsize)
+        fig = self._get_figure(figsize)
+        ax = fig.add_subplot()
 
         # Get transform for extent
         transform = metadata['transform']
@@ -264,8 +355,13 @@ class Visualizer:
         extent = [bounds[0], bounds[2], bounds[1], bounds[3]]
 
         # Plot distance field as heatmap
-        cmap = self.config.get('visualization.colormap', 'YlOrRd')
-        distance_km = distance_field / 1000
+        cmap = self._get_cmap(
+            self.config.get('visualization.colormap', 'YlOrRd'))
+        dpi = self.config.get('visualization.dpi', 300)
+        distance_km, extent = downsample_for_display(distance_field, extent,
+                                                     figsize, dpi)
+        distance_km = (distance_km.astype(np.float32, copy=False) *
+                       np.float32(0.001))
 
         im = ax.imshow(distance_km,
                        extent=extent,
@@ -275,7 +371,7 @@ class Visualizer:
                        alpha=0.7)
 
         # Add colorbar
-        cbar = plt.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
+        cbar = fig.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
         cbar.set_label('Distance from Road (km)',
                        rotation=270,
                        labelpad=20,
@@ -296,7 +392,7 @@ class Visualizer:
         roads_sample.plot(ax=ax, color='gray', linewidth=0.2, alpha=0.2)
 
         # Plot top N points with numbered labels
-        colors = plt.cm.rainbow(np.linspace(0, 1, n))
+        colors = self._get_cmap('rainbow')(np.linspace(0, 1, n))
 
         for point in top_n_points:
             rank = point['rank']
@@ -391,14 +487,14 @@ class Visualizer:
                   title_fontsize=9)
 
         # Tight layout
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Save
-        dpi = self.config.get('visualization.dpi', 300)
-        plt.savefig(output_path, dpi=dpi, bbox_inches='tight')
+        fig.savefig(output_path, dpi=dpi, bbox_inches='tight')
         print(f"  Saved labeled map to {output_path}")
 
-        plt.close()
+        # Drop the map's artists (and its image data) until the next map
+        fig.clf()
 
         return output_path
 
@@ -425,6 +521,13 @@ class Visualizer:
         """
         print("Creating interactive map...")
 
+        m = self._build_interactive_map(distance_field, boundary, roads,
+                                        unreachable_point, results)
+        return self._save_interactive_map(m, output_path)
+
+    def _save_interactive_map(self, m: folium.Map,
+                              output_path: Optional[Path] = None) -> Path:
+        """Save a folium map to output_path (or the default HTML path)."""
         if output_path is None:
             state_name = self.config.state_name.lower()
             outputs_dir = self.config.get_path('outputs')
@@ -432,8 +535,28 @@ class Visualizer:
             state_output_dir.mkdir(parents=True, exist_ok=True)
             output_path = state_output_dir / "unreachability_interactive.html"
 
-        # Convert to WGS84 for folium
+        m.save(str(output_path))
+        print(f"  Saved interactive map to {output_path}")
+
+        return output_path
+
+    def _build_interactive_map(self,
+                               distance_field: np.ndarray,
+                               boundary: gpd.GeoDataFrame,
+                               roads: gpd.GeoDataFrame,
+                               unreachable_point: Dict,
+                               results: Dict) -> folium.Map:
+        """
+        Build the folium map without printing or saving it.
+
+        Kept silent so visualize_all can build it in a worker thread while
+        the static maps are drawn.
+        """
+        # Convert to WGS84 for folium, simplified to ~100 m (finer detail
+        # only bloats the embedded GeoJSON)
         boundary_wgs84 = boundary.to_crs('EPSG:4326')
+        boundary_wgs84 = boundary_wgs84.set_geometry(
+            boundary_wgs84.geometry.simplify(0.001, preserve_topology=True))
 
         # Get center of boundary for map center
         center_lat = unreachable_point['latitude']
@@ -502,39 +625,69 @@ class Visualizer:
         topn_layer = folium.FeatureGroup(name=f'Top {n} Unreachable Points',
                                          show=True)
 
-        for point in top_n_points:
-            rank = point['rank']
-            lat = point['latitude']
-            lon = point['longitude']
-            dist_km = point['distance_km']
-
-            # Color scheme: red for #1, orange for #2-3, lighter for rest
-            if rank == 1:
-                color = 'red'
-                icon_color = 'white'
-            elif rank <= 3:
-                color = 'orange'
-                icon_color = 'white'
-            else:
-                color = 'lightred'
-                icon_color = 'white'
-
-            # Use numbered markers for top N
-            folium.Marker(
-                location=[lat, lon],
-                popup=folium.Popup(
-                    f"<b>Rank #{rank}</b><br>"
-                    f"Distance: {dist_km:.2f} km<br>"
-                    f"Lat: {lat:.6f}<br>"
-                    f"Lon: {lon:.6f}",
-                    max_width=300),
-                tooltip=f"#{rank}: {dist_km:.2f} km from road",
-                icon=folium.plugins.BeautifyIcon(
-                    number=str(rank),
-                    border_color=color,
-                    background_color=color,
-                    text_color=icon_color,
-                    inner_icon_style='margin-top:0;')).add_to(topn_layer)
+        if n > MAX_NUMBERED_MARKERS:
+            # Many points: one GeoJSON layer that leaflet renders in a batch
+            # instead of a separate marker object per point
+            features = [{
+                'type': 'Feature',
+                'geometry': {
+                    'type': 'Point',
+                    'coordinates': [point['longitude'], point['latitude']]
+                },
+                'properties': {
+                    'rank': point['rank'],
+                    'distance_km': round(point['distance_km'], 2)
+                }
+            } for point in top_n_points]
+
+            folium.GeoJson(
+                {
+                    'type': 'FeatureCollection',
+                    'features': features
+                },
+                marker=folium.CircleMarker(radius=6,
+                                           color='white',
+                                           weight=1,
+                                           fill=True,
+                                           fill_color='orange',
+                                           fill_opacity=0.9),
+                tooltip=folium.GeoJsonTooltip(
+                    fields=['rank', 'distance_km'],
+                    aliases=['Rank', 'Distance (km)'])).add_to(topn_layer)
+        else:
+            for point in top_n_points:
+                rank = point['rank']
+                lat = point['latitude']
+                lon = point['longitude']
+                dist_km = point['distance_km']
+
+                # Color scheme: red for #1, orange for #2-3, lighter for rest
+                if rank == 1:
+                    color = 'red'
+                    icon_color = 'white'
+                elif rank <= 3:
+                    color = 'orange'
+                    icon_color = 'white'
+                else:
+                    color = 'lightred'
+                    icon_color = 'white'
+
+                # Use numbered markers for top N
+                folium.Marker(
+                    location=[lat, lon],
+                    popup=folium.Popup(
+                        f"<b>Rank #{rank}</b><br>"
+                        f"Distance: {dist_km:.2f} km<br>"
+                        f"Lat: {lat:.6f}<br>"
+                        f"Lon: {lon:.6f}",
+                        max_width=300),
+                    tooltip=f"#{rank}: {dist_km:.2f} km from road",
+                    icon=folium.plugins.BeautifyIcon(
+                        number=str(rank),
+                        border_color=color,
+                        background_color=color,
+                        text_color=icon_color,
+                        inner_icon_style='margin-top:0;')).add_to(topn_layer)
 
         topn_layer.add_to(m)
 
@@ -559,11 +712,7 @@ class Visualizer:
         '''
         m.get_root().html.add_child(folium.Element(title_html))
 
-        # Save
-        m.save(str(output_path))
-        print(f"  Saved interactive map to {output_path}")
-
-        return output_path
+        return m
 
     def visualize_all(self, distance_data: dict, processed_data: dict,
                       results: dict) -> dict:
@@ -599,28 +748,41 @@ class Visualizer:
 
         outputs = {}
 
-        # Static map
-        if self.config.get('output.static_map', True):
-            print("\n1. Creating static map...")
-            static_path = self.create_static_map(distance_field, boundary,
-                                                 roads, unreachable_point,
-                                                 metadata, elevation_extremes)
-            outputs['static_map'] = static_path
-
-        # Labeled map with top N
-        if self.config.get('output.labeled_map', True):
-            print(f"\n2. Creating labeled map with top {n} locations...")
-            labeled_path = self.create_labeled_map(distance_field, boundary,
-                                                   roads, top_n_points,
-                                                   metadata)
-            outputs['labeled_map'] = labeled_path
-
-        # Interactive map
-        if self.config.get('output.interactive_map', True):
-            print("\n3. Creating interactive map...")
-            interactive_path = self.create_interactive_map(
-                distance_field, boundary, roads, unreachable_point, results)
-            outputs['interactive_map'] = interactive_path
+        def create_static_maps():
+            # Both maps share the Visualizer's figure, so they run in turn
+            static_outputs = {}
+
+            # Static map
+            if self.config.get('output.static_map', True):
+                print("\n1. Creating static map...")
+                static_outputs['static_map'] = self.create_static_map(
+                    distance_field, boundary, roads, unreachable_point,
+                    metadata, elevation_extremes)
+
+            # Labeled map with top N
+            if self.config.get('output.labeled_map', True):
+                print(f"\n2. Creating labeled map with top {n} locations...")
+                static_outputs['labeled_map'] = self.create_labeled_map(
+                    distance_field, boundary, roads, top_n_points, metadata)
+
+            return static_outputs
+
+        # The interactive map (folium HTML) is independent of the matplotlib
+        # maps, so it is built alongside them; it is reported and saved
+        # afterwards so the console log stays in step order
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            interactive_future = None
+            if self.config.get('output.interactive_map', True):
+                interactive_future = executor.submit(
+                    self._build_interactive_map, distance_field, boundary,
+                    roads, unreachable_point, results)
+
+            outputs.update(create_static_maps())
+
+            if interactive_future is not None:
+                print("\n3. Creating interactive map...")
+                outputs['interactive_map'] = self._save_interactive_map(
+                    interactive_future.result())
 
         print("=" * 60)
         print("VISUALIZATION COMPLETE")